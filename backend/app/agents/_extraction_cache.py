@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import hashlib
+from contextvars import ContextVar
+from functools import lru_cache
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+import orjson
+
+if TYPE_CHECKING:
+    from app.agents.form_auditor.models import ExtractedIrsForm990PfDataSchema
+
+__all__ = ["extraction_cache_scope", "raw_ein", "validate_extraction"]
+
+_CacheKey = Tuple[str, str]
+
+_extractions: ContextVar[
+    Optional[dict[_CacheKey, "ExtractedIrsForm990PfDataSchema"]]
+] = ContextVar("extractions", default=None)
+
+
+async def extraction_cache_scope() -> None:
+    """
+    FastAPI dependency that starts an empty extraction cache for the request.
+
+    Each request runs in its own task context, so the cache never outlives it.
+    """
+    _extractions.set({})
+
+
+@lru_cache(maxsize=1)
+def _models() -> ModuleType:
+    # Imported lazily: both agent packages import this module.
+    from app.agents.form_auditor import models
+
+    return models
+
+
+def _raw_metadata(payload: Any) -> Optional[dict[str, Any]]:
+    if not isinstance(payload, dict):
+        return None
+    metadata = payload.get("core_organization_metadata", payload)
+    return metadata if isinstance(metadata, dict) else None
+
+
+def raw_ein(payload: Any) -> str:
+    """EIN read from an unvalidated extraction payload (nested or flat), or ``""``."""
+    metadata = _raw_metadata(payload)
+    ein = metadata.get("ein") if metadata is not None else None
+    return str(ein) if ein else ""
+
+
+def _cache_key(payload: Any) -> Optional[_CacheKey]:
+    # Keyed on the payload content: extractions rarely carry a calendar year, so
+    # (EIN, year) would collapse every filing of an organization into one entry.
+    ein = raw_ein(payload)
+    if not ein:
+        return None
+    try:
+        raw = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+    return ein, hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def validate_extraction(payload: Any) -> ExtractedIrsForm990PfDataSchema:
+    """
+    Validate an extraction payload, reusing the request's parsed copy if a
+    payload with the same content was already validated.
+
+    Flat extractor payloads are reshaped into the nested schema first. Raw
+    JSON (``str``/``bytes``) must already be nested; it is parsed directly by
+    pydantic-core and is not cached. Cached extractions are shared between
+    agents and must be treated as read-only.
+    """
+    models = _models()
+    validator = models.EXTRACTION_VALIDATOR
+    if isinstance(payload, (str, bytes, bytearray)):
+        return validator.validate_json(payload)
+
+    cache = _extractions.get()
+    key = _cache_key(payload) if cache is not None else None
+
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    extraction = validator.validate_python(models.nest_flat_payload(payload))
+    if key is not None:
+        cache[key] = extraction
+    return extraction
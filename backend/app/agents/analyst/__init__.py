@@ -1,30 +1,38 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, List
+import asyncio
+from typing import Any, Iterable, List, Sequence, Tuple
 
+from app.agents._extraction_cache import raw_ein, validate_extraction
 from app.agents.form_auditor.models import ExtractedIrsForm990PfDataSchema
+from app.core.llm_runtime import run_agent
 
-from .agent import agent
+from .agent import ANALYSIS_PROMPT, get_agent
+from .batch import run_analysis_batch
 from .metrics import SnapshotBundle, build_key_metrics, build_snapshots
 from .models import AnalystReport, AnalystState
 
-__all__ = ["build_performance_report"]
+__all__ = ["build_performance_report", "build_performance_report_batch"]
 
 
 def _resolve_year(
     entry: dict[str, Any], extraction: ExtractedIrsForm990PfDataSchema
 ) -> int:
-    candidates: Iterable[Any] = (
-        entry.get("calendar_year"),
+    calendar_year = entry.get("calendar_year")
+    if type(calendar_year) is int:
+        return calendar_year
+
+    metadata = entry.get("metadata")
+    if not isinstance(metadata, dict):
+        metadata = {}
+
+    candidates = (
+        calendar_year,
         entry.get("year"),
         entry.get("tax_year"),
         entry.get("return_year"),
-        entry.get("metadata", {}).get("return_year")
-        if isinstance(entry.get("metadata"), dict)
-        else None,
-        entry.get("metadata", {}).get("tax_year")
-        if isinstance(entry.get("metadata"), dict)
-        else None,
+        metadata.get("return_year"),
+        metadata.get("tax_year"),
         extraction.core_organization_metadata.calendar_year,
     )
     for candidate in candidates:
@@ -37,26 +45,45 @@ def _resolve_year(
     raise ValueError("Unable to determine filing year for one of the payload entries.")
 
 
-async def build_performance_report(payloads: List[dict[str, Any]]) -> AnalystReport:
+async def validate_payloads(
+    payloads: List[dict[str, Any]],
+) -> List[Tuple[dict[str, Any], ExtractedIrsForm990PfDataSchema]]:
     if not payloads:
         raise ValueError("At least one payload is required for performance analysis.")
 
-    bundles: List[SnapshotBundle] = []
-
-    organisation_name = ""
-    organisation_ein = ""
-
+    extraction_payloads: List[Any] = []
     for entry in payloads:
         if not isinstance(entry, dict):
             raise TypeError("Each payload entry must be a dict.")
+        extraction_payloads.append(
+            entry.get("extraction") if "extraction" in entry else entry
+        )
+
+    # Fail on mixed organizations before paying for any schema validation.
+    if len({ein for ein in map(raw_ein, extraction_payloads) if ein}) > 1:
+        raise ValueError("All payload entries must belong to the same organization.")
+
+    extractions = await asyncio.gather(
+        *(
+            asyncio.to_thread(validate_extraction, payload)
+            for payload in extraction_payloads
+        )
+    )
+    return list(zip(payloads, extractions))
+
+
+def build_bundles(
+    validated: Iterable[Tuple[dict[str, Any], ExtractedIrsForm990PfDataSchema]],
+) -> List[SnapshotBundle]:
+    bundles: List[SnapshotBundle] = []
 
-        extraction_payload = entry.get("extraction") if "extraction" in entry else entry
-        extraction = ExtractedIrsForm990PfDataSchema.model_validate(extraction_payload)
+    organisation_ein = ""
+
+    for entry, extraction in validated:
         year = _resolve_year(entry, extraction)
 
         if not organisation_ein:
             organisation_ein = extraction.core_organization_metadata.ein
-            organisation_name = extraction.core_organization_metadata.legal_name
         else:
             if extraction.core_organization_metadata.ein != organisation_ein:
                 raise ValueError(
@@ -65,48 +92,101 @@ async def build_performance_report(payloads: List[dict[str, Any]]) -> AnalystRep
 
         bundles.append(SnapshotBundle(year=year, extraction=extraction))
 
-    bundles.sort(key=lambda bundle: bundle.year)
-    snapshots = build_snapshots(bundles)
-    metrics = build_key_metrics(snapshots)
-
-    notes = []
-    if metrics:
-        revenue_metric = metrics[0]
-        expense_metric = metrics[1] if len(metrics) > 1 else None
-        if revenue_metric.cagr is not None:
-            notes.append(f"Revenue CAGR: {revenue_metric.cagr:.2%}")
-        if expense_metric and expense_metric.cagr is not None:
-            notes.append(f"Expense CAGR: {expense_metric.cagr:.2%}")
-        surplus_metric = next(
-            (m for m in metrics if m.name == "Operating Surplus"), None
-        )
-        if surplus_metric:
-            last_value = surplus_metric.points[-1].value if surplus_metric.points else 0
-            notes.append(f"Latest operating surplus: {last_value:,.0f}")
-
-    state = AnalystState(
-        organisation_name=organisation_name,
-        organisation_ein=organisation_ein,
-        series=snapshots,
+    return bundles
+
+
+def build_analyst_state(bundles: List[SnapshotBundle]) -> AnalystState:
+    core = bundles[0].extraction.core_organization_metadata
+    # Upstream usually sends filings oldest-first; only sort when it did not.
+    if any(prev.year > curr.year for prev, curr in zip(bundles, bundles[1:])):
+        bundles = sorted(bundles, key=lambda bundle: bundle.year)
+    series = build_snapshots(bundles)
+    metrics = build_key_metrics(series)
+
+    notes = [
+        f"{label} CAGR: {metric.cagr:.2%}"
+        for label, metric in zip(("Revenue", "Expense"), metrics)
+        if metric.cagr is not None
+    ]
+    surplus_metric = next((m for m in metrics if m.name == "Operating Surplus"), None)
+    if surplus_metric:
+        last_value = surplus_metric.points[-1].value if surplus_metric.points else 0
+        notes.append(f"Latest operating surplus: {last_value:,.0f}")
+
+    return AnalystState(
+        organisation_name=core.legal_name,
+        organisation_ein=core.ein,
+        series=series,
         key_metrics=metrics,
         notes=notes,
     )
 
-    prompt = (
-        "Analyze the provided multi-year financial context. Quantify notable trends, "
-        "call out risks or strengths, and supply actionable recommendations. "
-        "Capture both positive momentum and areas requiring attention."
-    )
-    result = await agent.run(prompt, deps=state)
-    report = result.output
-
-    years = [snapshot.year for snapshot in snapshots]
-
-    return report.model_copy(
-        update={
-            "organisation_name": organisation_name,
-            "organisation_ein": organisation_ein,
-            "years_analyzed": years,
-            "key_metrics": metrics,
-        }
+
+_SINGLE_YEAR_OUTLOOK = "Insufficient history for trend analysis."
+
+
+def _single_year_report(state: AnalystState) -> AnalystReport:
+    return _apply_state(
+        AnalystReport(
+            organisation_name=state.organisation_name,
+            organisation_ein=state.organisation_ein,
+            outlook=_SINGLE_YEAR_OUTLOOK,
+        ),
+        state,
     )
+
+
+async def run_analysis(state: AnalystState) -> AnalystReport:
+    if len(state.series.years) == 1:
+        return _single_year_report(state)
+
+    result = await run_agent(get_agent(), ANALYSIS_PROMPT, state)
+    return _apply_state(result.output, state)
+
+
+def _apply_state(report: AnalystReport, state: AnalystState) -> AnalystReport:
+    report.organisation_name = state.organisation_name
+    report.organisation_ein = state.organisation_ein
+    report.years_analyzed = list(state.series.years)
+    report.key_metrics = state.key_metrics
+    return report
+
+
+async def build_performance_report(payloads: List[dict[str, Any]]) -> AnalystReport:
+    """
+    Build the multi-year performance report for one organization.
+
+    A single filing year has no trend to analyze, so no LLM call is made: the
+    report carries the deterministic key metrics, no insights or
+    recommendations, and an "Insufficient history" outlook.
+    """
+    validated = await validate_payloads(payloads)
+    bundles = build_bundles(validated)
+    state = build_analyst_state(bundles)
+    return await run_analysis(state)
+
+
+async def build_performance_report_batch(
+    payloads_per_org: Sequence[List[dict[str, Any]]],
+) -> List[AnalystReport]:
+    """
+    Analyze many organizations through the Azure OpenAI Batch API.
+
+    Meant for offline/nightly jobs: results arrive within the batch completion
+    window instead of interactively, at batch pricing. Reports are returned in
+    the same order as ``payloads_per_org``; single-year organizations are
+    answered locally and never sent to the batch.
+    """
+    states: List[AnalystState] = []
+    for payloads in payloads_per_org:
+        validated = await validate_payloads(payloads)
+        states.append(build_analyst_state(build_bundles(validated)))
+
+    multi_year = [state for state in states if len(state.series.years) > 1]
+    reports = iter(await run_analysis_batch(multi_year))
+    return [
+        _apply_state(next(reports), state)
+        if len(state.series.years) > 1
+        else _single_year_report(state)
+        for state in states
+    ]
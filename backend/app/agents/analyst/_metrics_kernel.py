@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ._njit import njit
+
+DIRECTION_STABLE = 0
+DIRECTION_IMPROVING = 1
+DIRECTION_DECLINING = 2
+DIRECTION_VOLATILE = 3
+
+
+@njit(cache=True)
+def growth_series(values: np.ndarray) -> np.ndarray:
+    growth = np.full(values.shape[0], np.nan)
+    if values.shape[0] < 2:
+        return growth
+    previous = values[:-1]
+    nonzero = previous != 0
+    safe_previous = np.where(nonzero, previous, 1.0)
+    growth[1:] = np.where(nonzero, (values[1:] - previous) / safe_previous, np.nan)
+    return growth
+
+
+@njit(cache=True)
+def growth_rows(values: np.ndarray) -> np.ndarray:
+    growth = np.full(values.shape, np.nan)
+    if values.shape[1] < 2:
+        return growth
+    previous = values[:, :-1]
+    nonzero = previous != 0
+    safe_previous = np.where(nonzero, previous, 1.0)
+    growth[:, 1:] = np.where(
+        nonzero, (values[:, 1:] - previous) / safe_previous, np.nan
+    )
+    return growth
+
+
+@njit(cache=True)
+def cagr_rows(values: np.ndarray) -> np.ndarray:
+    rates = np.full(values.shape[0], np.nan)
+    periods = values.shape[1] - 1
+    if periods <= 0:
+        return rates
+    start = values[:, 0]
+    end = values[:, -1]
+    valid = (start > 0) & (end > 0)
+    safe_start = np.where(valid, start, 1.0)
+    safe_end = np.where(valid, end, 1.0)
+    rates[:] = np.where(valid, (safe_end / safe_start) ** (1 / periods) - 1, np.nan)
+    return rates
+
+
+@njit(cache=True)
+def direction_rows(values: np.ndarray) -> np.ndarray:
+    """Direction code per row; rows must not contain NaN."""
+    count = values.shape[1]
+    codes = np.full(values.shape[0], DIRECTION_STABLE)
+    if count < 2:
+        return codes
+
+    start = values[:, 0]
+    delta = values[:, -1] - start
+    tolerance = np.where(start != 0, np.abs(start) * 0.02, 0.01)
+    trending = np.abs(delta) > tolerance
+
+    codes[trending & (delta > 0)] = DIRECTION_IMPROVING
+    codes[trending & (delta <= 0)] = DIRECTION_DECLINING
+
+    if count > 2:
+        steps = values[:, 1:] - values[:, :-1]
+        swings = (steps[:, :-1] * steps[:, 1:] < 0).sum(axis=1)
+        codes[trending & (swings >= count // 2)] = DIRECTION_VOLATILE
+
+    return codes
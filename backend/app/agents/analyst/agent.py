@@ -1,33 +1,45 @@
 from __future__ import annotations
 
-from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.azure import AzureProvider
+from functools import cache
 
-from app.core.config import settings
+from pydantic_ai import Agent, RunContext
+
+from app.core.llm import get_azure_chat_model
 
 from .models import AnalystReport, AnalystState
 
-provider = AzureProvider(
-    azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-    api_version=settings.AZURE_OPENAI_API_VERSION,
-    api_key=settings.AZURE_OPENAI_API_KEY,
+SYSTEM_PROMPT = (
+    "You are a nonprofit financial analyst. You receive multi-year Form 990 extractions "
+    "summarized into deterministic metrics (series, ratios, surplus, CAGR). Use the context "
+    "to highlight performance trends, governance implications, and forward-looking risks. "
+    "Focus on numeric trends: revenue growth, expense discipline, surplus stability, "
+    "program-vs-admin mix, and fundraising efficiency. Provide concise bullet insights, "
+    "clear recommendations tied to the data, and a balanced outlook (strengths vs watch items). "
+    "Only cite facts available in the provided series—do not invent figures. "
+    "The `series` context is columnar: `years` lists the filing years and every other "
+    "list holds that field's value for the year at the same index."
 )
 
-model = OpenAIChatModel(model_name="gpt-4o", provider=provider)
-
-agent = Agent(
-    model=model,
-    name="MultiYearAnalyst",
-    deps_type=AnalystState,
-    output_type=AnalystReport,
-    system_prompt=(
-        "You are a nonprofit financial analyst. You receive multi-year Form 990 extractions "
-        "summarized into deterministic metrics (series, ratios, surplus, CAGR). Use the context "
-        "to highlight performance trends, governance implications, and forward-looking risks. "
-        "Focus on numeric trends: revenue growth, expense discipline, surplus stability, "
-        "program-vs-admin mix, and fundraising efficiency. Provide concise bullet insights, "
-        "clear recommendations tied to the data, and a balanced outlook (strengths vs watch items). "
-        "Only cite facts available in the provided series—do not invent figures."
-    ),
+ANALYSIS_PROMPT = (
+    "Analyze the provided multi-year financial context. Quantify notable trends, "
+    "call out risks or strengths, and supply actionable recommendations. "
+    "Capture both positive momentum and areas requiring attention."
 )
+
+
+def analysis_context(ctx: RunContext[AnalystState]) -> str:
+    return f"Context:\n{ctx.deps.model_dump_json()}"
+
+
+@cache
+def get_agent() -> Agent[AnalystState, AnalystReport]:
+    """Build the analyst agent on first use so importing the package stays cheap."""
+    agent = Agent(
+        model=get_azure_chat_model(),
+        name="MultiYearAnalyst",
+        deps_type=AnalystState,
+        output_type=AnalystReport,
+        system_prompt=SYSTEM_PROMPT,
+    )
+    agent.system_prompt(analysis_context)
+    return agent
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List, Sequence
+
+import orjson
+
+from app.core.llm import get_azure_chat_model
+
+from .agent import ANALYSIS_PROMPT, SYSTEM_PROMPT
+from .models import AnalystReport, AnalystState
+
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _batch_request(
+    custom_id: str,
+    state: AnalystState,
+    deployment: str,
+    response_format: dict[str, Any],
+) -> bytes:
+    body: dict[str, Any] = {
+        "model": deployment,
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "system", "content": f"Context:\n{state.model_dump_json()}"},
+            {"role": "user", "content": ANALYSIS_PROMPT},
+        ],
+        "response_format": response_format,
+    }
+    return orjson.dumps(
+        {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/chat/completions",
+            "body": body,
+        }
+    )
+
+
+async def run_analysis_batch(
+    states: Sequence[AnalystState],
+    poll_interval: float = 30.0,
+) -> List[AnalystReport]:
+    if not states:
+        return []
+
+    model = get_azure_chat_model()
+    client = model.client
+
+    # The schema is identical for every line, so build it once per batch.
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "AnalystReport",
+            "schema": AnalystReport.model_json_schema(),
+        },
+    }
+    lines = [
+        _batch_request(str(idx), state, model.model_name, response_format)
+        for idx, state in enumerate(states)
+    ]
+    batch_file = await client.files.create(
+        file=("analyst_batch.jsonl", b"\n".join(lines)),
+        purpose="batch",
+    )
+    batch = await client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint="/chat/completions",
+        completion_window="24h",
+    )
+
+    while batch.status not in _TERMINAL_STATUSES:
+        await asyncio.sleep(poll_interval)
+        batch = await client.batches.retrieve(batch.id)
+
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(
+            f"Azure batch {batch.id} finished with status {batch.status}."
+        )
+
+    output = await client.files.content(batch.output_file_id)
+
+    reports: dict[int, AnalystReport] = {}
+    failed: List[str] = []
+    for line in output.content.splitlines():
+        if not line.strip():
+            continue
+        record = orjson.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            failed.append(record.get("custom_id", "?"))
+            continue
+        content = response["body"]["choices"][0]["message"]["content"]
+        reports[int(record["custom_id"])] = AnalystReport.model_validate_json(content)
+
+    missing = [str(idx) for idx in range(len(states)) if idx not in reports]
+    if failed or missing:
+        raise RuntimeError(
+            f"Azure batch {batch.id} returned no report for requests: "
+            f"{', '.join(sorted(set(failed) | set(missing)))}."
+        )
+
+    return [reports[idx] for idx in range(len(states))]
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from operator import attrgetter
+from typing import List, Sequence, Tuple
+
+import numpy as np
 
 from app.agents.form_auditor.models import ExtractedIrsForm990PfDataSchema
 
-from .models import TrendDirection, TrendMetric, TrendMetricPoint, YearlySnapshot
+from ._metrics_kernel import (
+    DIRECTION_DECLINING,
+    DIRECTION_IMPROVING,
+    DIRECTION_STABLE,
+    DIRECTION_VOLATILE,
+    cagr_rows,
+    direction_rows,
+    growth_rows,
+    growth_series,
+)
+from .models import SeriesTable, TrendDirection, TrendMetric, TrendMetricPoint
 
 
 @dataclass
@@ -14,178 +27,122 @@ class SnapshotBundle:
     extraction: ExtractedIrsForm990PfDataSchema
 
 
-def _safe_ratio(numerator: float, denominator: float) -> float | None:
-    if denominator in (0, None):
-        return None
-    try:
-        return numerator / denominator
-    except ZeroDivisionError:
-        return None
-
-
-def _growth(current: float, previous: float | None) -> float | None:
-    if previous in (None, 0):
-        return None
-    try:
-        return (current - previous) / previous
-    except ZeroDivisionError:
-        return None
-
-
-def _direction_from_points(values: Sequence[float | None]) -> TrendDirection:
-    clean = [value for value in values if value is not None]
-    if len(clean) < 2:
-        return TrendDirection.STABLE
+_DIRECTIONS = {
+    DIRECTION_STABLE: TrendDirection.STABLE,
+    DIRECTION_IMPROVING: TrendDirection.IMPROVING,
+    DIRECTION_DECLINING: TrendDirection.DECLINING,
+    DIRECTION_VOLATILE: TrendDirection.VOLATILE,
+}
 
-    start, end = clean[0], clean[-1]
-    if start is None or end is None:
-        return TrendDirection.STABLE
 
-    delta = end - start
-    tolerance = abs(start) * 0.02 if start else 0.01
-    if abs(delta) <= tolerance:
-        return TrendDirection.STABLE
+def _ratio_series(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.full_like(numerator, np.nan),
+        where=denominator != 0,
+    )
 
-    if len(clean) > 2:
-        swings = sum(
-            1
-            for idx in range(1, len(clean) - 1)
-            if (clean[idx] - clean[idx - 1]) * (clean[idx + 1] - clean[idx]) < 0
-        )
-        if swings >= len(clean) // 2:
-            return TrendDirection.VOLATILE
-
-    return TrendDirection.IMPROVING if delta > 0 else TrendDirection.DECLINING
-
-
-def _cagr(start: float | None, end: float | None, periods: int) -> float | None:
-    if start is None or end is None or start <= 0 or end <= 0 or periods <= 0:
-        return None
-    return (end / start) ** (1 / periods) - 1
-
-
-def build_snapshots(bundles: Sequence[SnapshotBundle]) -> List[YearlySnapshot]:
-    snapshots: List[YearlySnapshot] = []
-    previous_revenue = None
-    previous_expenses = None
-
-    for bundle in bundles:
-        rev = bundle.extraction.revenue_breakdown.total_revenue
-        exp = bundle.extraction.expenses_breakdown.total_expenses
-        program = bundle.extraction.expenses_breakdown.program_services_expenses
-        admin = bundle.extraction.expenses_breakdown.management_general_expenses
-        fundraising = bundle.extraction.expenses_breakdown.fundraising_expenses
-
-        snapshots.append(
-            YearlySnapshot(
-                year=bundle.year,
-                total_revenue=rev,
-                total_expenses=exp,
-                revenue_growth=_growth(rev, previous_revenue),
-                expense_growth=_growth(exp, previous_expenses),
-                surplus=rev - exp,
-                program_ratio=_safe_ratio(program, exp),
-                admin_ratio=_safe_ratio(admin, exp),
-                fundraising_ratio=_safe_ratio(fundraising, exp),
-                net_margin=_safe_ratio(rev - exp, rev),
-            )
-        )
-        previous_revenue = rev
-        previous_expenses = exp
 
-    return snapshots
+def _optional(values: np.ndarray) -> List[float | None]:
+    return [None if value != value else value for value in values.tolist()]
+
+
+_snapshot_row = attrgetter(
+    "revenue_breakdown.total_revenue",
+    "expenses_breakdown.total_expenses",
+    "expenses_breakdown.program_services_expenses",
+    "expenses_breakdown.management_general_expenses",
+    "expenses_breakdown.fundraising_expenses",
+)
+
+
+def build_snapshots(bundles: Sequence[SnapshotBundle]) -> SeriesTable:
+    columns = np.array(
+        [_snapshot_row(bundle.extraction) for bundle in bundles],
+        dtype=np.float64,
+    ).reshape(-1, 5)
+    rev, exp, program, admin, fundraising = columns.T
+    surplus = rev - exp
+
+    return SeriesTable(
+        years=[bundle.year for bundle in bundles],
+        total_revenue=rev.tolist(),
+        total_expenses=exp.tolist(),
+        revenue_growth=_optional(growth_series(rev)),
+        expense_growth=_optional(growth_series(exp)),
+        surplus=surplus.tolist(),
+        program_ratio=_optional(_ratio_series(program, exp)),
+        admin_ratio=_optional(_ratio_series(admin, exp)),
+        fundraising_ratio=_optional(_ratio_series(fundraising, exp)),
+        net_margin=_optional(_ratio_series(surplus, rev)),
+    )
 
 
-def _metric_from_series(
-    name: str,
-    unit: str,
-    description: str,
-    values: Iterable[Tuple[int, float | None]],
-) -> TrendMetric:
-    points = [
-        TrendMetricPoint(year=year, value=value or 0.0, growth=None)
-        for year, value in values
-    ]
+_METRIC_DEFINITIONS: Tuple[Tuple[str, str, str], ...] = (
+    ("Total Revenue", "USD", "Reported total revenue in Part I."),
+    ("Total Expenses", "USD", "Reported total expenses in Part I."),
+    (
+        "Operating Surplus",
+        "USD",
+        "Difference between total revenue and total expenses.",
+    ),
+    (
+        "Program Service Ratio",
+        "Ratio",
+        "Program service expenses divided by total expenses.",
+    ),
+    (
+        "Administrative Ratio",
+        "Ratio",
+        "Management & general expenses divided by total expenses.",
+    ),
+    (
+        "Fundraising Ratio",
+        "Ratio",
+        "Fundraising expenses divided by total expenses.",
+    ),
+)
+
+
+def build_key_metrics(series: SeriesTable) -> List[TrendMetric]:
+    if not series.years:
+        return []
 
-    for idx in range(1, len(points)):
-        prev = points[idx - 1].value
-        curr = points[idx].value
-        points[idx].growth = _growth(curr, prev)
-
-    data_values = [point.value for point in points]
-    direction = _direction_from_points(data_values)
-    cagr = None
-    if len(points) >= 2:
-        cagr = _cagr(points[0].value, points[-1].value, len(points) - 1)
-
-    return TrendMetric(
-        name=name,
-        unit=unit,
-        description=description,
-        points=points,
-        cagr=cagr,
-        direction=direction,
+    columns = np.array(
+        [
+            series.total_revenue,
+            series.total_expenses,
+            series.surplus,
+            series.program_ratio,
+            series.admin_ratio,
+            series.fundraising_ratio,
+        ],
+        dtype=np.float64,
     )
+    columns = np.nan_to_num(columns, nan=0.0)
 
-
-def build_key_metrics(snapshots: Sequence[YearlySnapshot]) -> List[TrendMetric]:
-    if not snapshots:
-        return []
+    growth = growth_rows(columns)
+    rates = _optional(cagr_rows(columns))
+    directions = direction_rows(columns).tolist()
 
     metrics = [
-        _metric_from_series(
-            "Total Revenue",
-            "USD",
-            "Reported total revenue in Part I.",
-            [(snap.year, snap.total_revenue) for snap in snapshots],
-        ),
-        _metric_from_series(
-            "Total Expenses",
-            "USD",
-            "Reported total expenses in Part I.",
-            [(snap.year, snap.total_expenses) for snap in snapshots],
-        ),
-        _metric_from_series(
-            "Operating Surplus",
-            "USD",
-            "Difference between total revenue and total expenses.",
-            [(snap.year, snap.surplus) for snap in snapshots],
-        ),
-        _metric_from_series(
-            "Program Service Ratio",
-            "Ratio",
-            "Program service expenses divided by total expenses.",
-            [
-                (
-                    snap.year,
-                    snap.program_ratio if snap.program_ratio is not None else 0.0,
+        TrendMetric(
+            name=name,
+            unit=unit,
+            description=description,
+            points=[
+                TrendMetricPoint(year=year, value=value, growth=point_growth)
+                for year, value, point_growth in zip(
+                    series.years, values, _optional(growth_row)
                 )
-                for snap in snapshots
-            ],
-        ),
-        _metric_from_series(
-            "Administrative Ratio",
-            "Ratio",
-            "Management & general expenses divided by total expenses.",
-            [
-                (snap.year, snap.admin_ratio if snap.admin_ratio is not None else 0.0)
-                for snap in snapshots
             ],
-        ),
-        _metric_from_series(
-            "Fundraising Ratio",
-            "Ratio",
-            "Fundraising expenses divided by total expenses.",
-            [
-                (
-                    snap.year,
-                    snap.fundraising_ratio
-                    if snap.fundraising_ratio is not None
-                    else 0.0,
-                )
-                for snap in snapshots
-            ],
-        ),
+            cagr=rate,
+            direction=_DIRECTIONS[direction],
+        )
+        for (name, unit, description), values, growth_row, rate, direction in zip(
+            _METRIC_DEFINITIONS, columns.tolist(), growth, rates, directions
+        )
     ]
 
     for metric in metrics:
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import List
+from typing import Annotated, List
 
 from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass
 
 
 class TrendDirection(str, Enum):
@@ -13,7 +14,8 @@ class TrendDirection(str, Enum):
     VOLATILE = "Volatile"
 
 
-class TrendMetricPoint(BaseModel):
+@dataclass(slots=True)
+class TrendMetricPoint:
     year: int
     value: float
     growth: float | None = Field(
@@ -40,7 +42,7 @@ class TrendInsight(BaseModel):
     category: str
     direction: TrendDirection
     summary: str
-    confidence: float = Field(default=0.7, ge=0.0, le=1.0)
+    confidence: Annotated[float, Field(ge=0.0, le=1.0)] = 0.7
 
 
 class AnalystReport(BaseModel):
@@ -53,22 +55,27 @@ class AnalystReport(BaseModel):
     outlook: str = "Pending analysis"
 
 
-class YearlySnapshot(BaseModel):
-    year: int
-    total_revenue: float
-    total_expenses: float
-    revenue_growth: float | None = None
-    expense_growth: float | None = None
-    surplus: float | None = None
-    program_ratio: float | None = None
-    admin_ratio: float | None = None
-    fundraising_ratio: float | None = None
-    net_margin: float | None = None
+class SeriesTable(BaseModel):
+    """
+    Year-by-year figures stored column-wise: index ``i`` of every list belongs
+    to ``years[i]``.
+    """
+
+    years: List[int] = Field(default_factory=list)
+    total_revenue: List[float] = Field(default_factory=list)
+    total_expenses: List[float] = Field(default_factory=list)
+    revenue_growth: List[float | None] = Field(default_factory=list)
+    expense_growth: List[float | None] = Field(default_factory=list)
+    surplus: List[float | None] = Field(default_factory=list)
+    program_ratio: List[float | None] = Field(default_factory=list)
+    admin_ratio: List[float | None] = Field(default_factory=list)
+    fundraising_ratio: List[float | None] = Field(default_factory=list)
+    net_margin: List[float | None] = Field(default_factory=list)
 
 
 class AnalystState(BaseModel):
     organisation_name: str
     organisation_ein: str
-    series: List[YearlySnapshot]
+    series: SeriesTable
     key_metrics: List[TrendMetric]
     notes: List[str] = Field(default_factory=list)
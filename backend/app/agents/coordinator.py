@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List
+
+from pydantic import BaseModel
+
+from app.agents import analyst, form_auditor
+from app.agents.analyst.models import AnalystReport
+from app.agents.form_auditor.models import AuditReport
+
+__all__ = ["CombinedReport", "build_combined_report"]
+
+
+class CombinedReport(BaseModel):
+    analysis: AnalystReport
+    audit: AuditReport
+
+
+async def build_combined_report(payloads: List[dict[str, Any]]) -> CombinedReport:
+    """
+    Run the analyst and the auditor for one organization in parallel.
+
+    Extractions are validated once and shared by both agents; the audit covers
+    the most recent filing year.
+    """
+    validated = await analyst.validate_payloads(payloads)
+    bundles = analyst.build_bundles(validated)
+
+    latest = max(bundles, key=lambda bundle: bundle.year)
+    latest_entry = next(
+        entry for entry, extraction in validated if extraction is latest.extraction
+    )
+    _, metadata_raw = form_auditor.split_payload(latest_entry)
+
+    analyst_state, validator_state = await asyncio.gather(
+        asyncio.to_thread(analyst.build_analyst_state, bundles),
+        form_auditor.prepare_validator_state(latest.extraction, metadata_raw),
+    )
+
+    analysis, audit = await asyncio.gather(
+        analyst.run_analysis(analyst_state),
+        form_auditor.run_audit(validator_state),
+    )
+    return CombinedReport(analysis=analysis, audit=audit)
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
-from .agent import agent, prepare_initial_findings
+from app.agents._extraction_cache import validate_extraction
+from app.core.llm_runtime import run_agent
+
+from .agent import AUDIT_PROMPT, get_agent, prepare_initial_findings
+from .checks import irs_ein_lookup
 from .models import (
     AuditReport,
     ExtractedIrsForm990PfDataSchema,
@@ -10,7 +15,7 @@ from .models import (
 )
 
 
-async def build_audit_report(payload: dict[str, Any]) -> AuditReport:
+def split_payload(payload: dict[str, Any]) -> tuple[Any, Any]:
     metadata_raw: Any = None
     extraction_payload: Any = None
 
@@ -23,25 +28,54 @@ async def build_audit_report(payload: dict[str, Any]) -> AuditReport:
     if extraction_payload is None:
         raise ValueError("Payload missing extraction data.")
 
-    extraction = ExtractedIrsForm990PfDataSchema.model_validate(extraction_payload)
+    return extraction_payload, metadata_raw
+
 
-    initial_findings = prepare_initial_findings(extraction)
+def build_validator_state(
+    extraction: ExtractedIrsForm990PfDataSchema,
+    metadata_raw: Any = None,
+) -> ValidatorState:
+    initial_findings = tuple(prepare_initial_findings(extraction))
 
     metadata: dict[str, Any] = {}
     if isinstance(metadata_raw, dict):
         metadata = {str(k): v for k, v in metadata_raw.items()}
 
-    state = ValidatorState(
+    return ValidatorState(
         extraction=extraction,
         initial_findings=initial_findings,
+        initial_findings_by_id={
+            finding.check_id: finding for finding in initial_findings
+        },
         metadata=metadata,
     )
 
-    prompt = (
-        "Review the Form 990 extraction and deterministic checks. Validate or adjust "
-        "the findings, add any additional issues or mitigations, and craft narrative "
-        "section summaries that highlight the most material points. Focus on concrete "
-        "evidence; do not fabricate figures."
+
+async def prepare_validator_state(
+    extraction: ExtractedIrsForm990PfDataSchema,
+    metadata_raw: Any = None,
+) -> ValidatorState:
+    """
+    Build the validator state off the event loop while the IRS EIN lookup runs,
+    so the agent's ``verify_ein`` tool can answer from the prefetched result.
+    """
+    state, ein_lookup = await asyncio.gather(
+        asyncio.to_thread(build_validator_state, extraction, metadata_raw),
+        irs_ein_lookup(extraction.core_organization_metadata.ein),
     )
-    result = await agent.run(prompt, deps=state)
+    state.ein_lookup = ein_lookup
+    return state
+
+
+async def run_audit(state: ValidatorState) -> AuditReport:
+    result = await run_agent(get_agent(), AUDIT_PROMPT, state)
     return result.output
+
+
+async def build_audit_report(payload: dict[str, Any]) -> AuditReport:
+    extraction_payload, metadata_raw = split_payload(payload)
+
+    extraction = validate_extraction(extraction_payload)
+
+    state = await prepare_validator_state(extraction, metadata_raw)
+    return await run_audit(state)
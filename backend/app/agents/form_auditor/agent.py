@@ -1,12 +1,11 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import cache
 
 from pydantic_ai import Agent, RunContext
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.azure import AzureProvider
 
-from app.core.config import settings
+from app.core.llm import get_azure_chat_model
 
 from .checks import (
     aggregate_findings,
@@ -29,13 +28,12 @@ from .models import (
     ValidatorState,
 )
 
-provider = AzureProvider(
-    azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-    api_version=settings.AZURE_OPENAI_API_VERSION,
-    api_key=settings.AZURE_OPENAI_API_KEY,
+AUDIT_PROMPT = (
+    "Review the Form 990 extraction and deterministic checks. Validate or adjust "
+    "the findings, add any additional issues or mitigations, and craft narrative "
+    "section summaries that highlight the most material points. Focus on concrete "
+    "evidence; do not fabricate figures."
 )
-model = OpenAIChatModel(model_name="gpt-4o", provider=provider)
-agent = Agent(model=model)
 
 
 def prepare_initial_findings(
@@ -54,50 +52,32 @@ def prepare_initial_findings(
 
 
 def _merge_findings(
-    findings: Iterable[AuditFinding],
+    findings_by_id: dict[str, AuditFinding],
     added: Iterable[AuditFinding],
-) -> list[AuditFinding]:
-    existing = {finding.check_id: finding for finding in findings}
-    for finding in added:
-        existing[finding.check_id] = finding
-    return list(existing.values())
-
-
-agent = Agent(
-    model=model,
-    name="FormValidator",
-    deps_type=ValidatorState,
-    output_type=AuditReport,
-    system_prompt=(
-        "You are a Form 990 auditor. Review the extraction data and deterministic "
-        "checks provided in deps. Use tools to confirm calculations, add or adjust "
-        "findings, supply mitigation guidance, and craft concise section summaries. "
-        "The AuditReport must include severity (`Pass`, `Warning`, `Error`), "
-        "confidence scores, mitigation advice, section summaries, and an overall summary. "
-        "Ground every statement in supplied data; do not invent financial figures."
-    ),
-)
+) -> tuple[AuditFinding, ...]:
+    merged = dict(findings_by_id)
+    merged |= {finding.check_id: finding for finding in added}
+    return tuple(merged.values())
 
 
-@agent.tool
 def revenue_check(ctx: RunContext[ValidatorState]) -> AuditFinding:
     return check_revenue_totals(ctx.deps.extraction)
 
 
-@agent.tool
 def expense_check(ctx: RunContext[ValidatorState]) -> AuditFinding:
     return check_expense_totals(ctx.deps.extraction)
 
 
-@agent.tool
 def fundraising_alignment_check(ctx: RunContext[ValidatorState]) -> AuditFinding:
     return check_fundraising_alignment(ctx.deps.extraction)
 
 
-@agent.tool
 async def verify_ein(ctx: RunContext[ValidatorState]) -> AuditFinding:
     ein = ctx.deps.extraction.core_organization_metadata.ein
-    exists, confidence, note = await irs_ein_lookup(ein)
+    lookup = ctx.deps.ein_lookup
+    if lookup is None:
+        lookup = await irs_ein_lookup(ein)
+    exists, confidence, note = lookup
     if exists:
         return AuditFinding(
             check_id="irs_ein_match",
@@ -117,12 +97,11 @@ async def verify_ein(ctx: RunContext[ValidatorState]) -> AuditFinding:
     )
 
 
-@agent.output_validator
 def finalize_report(
     ctx: RunContext[ValidatorState],
     report: AuditReport,
 ) -> AuditReport:
-    merged_findings = _merge_findings(ctx.deps.initial_findings, report.findings)
+    merged_findings = _merge_findings(ctx.deps.initial_findings_by_id, report.findings)
     overall = aggregate_findings(merged_findings)
     sections = build_section_summaries(merged_findings)
     overall_summary = compose_overall_summary(merged_findings)
@@ -139,17 +118,35 @@ def finalize_report(
             except (TypeError, ValueError):
                 pass
     core = ctx.deps.extraction.core_organization_metadata
-    organisation_name = core.legal_name or report.organisation_name
-    organisation_ein = core.ein or report.organisation_ein
-    return report.model_copy(
-        update={
-            "organisation_ein": organisation_ein,
-            "organisation_name": organisation_name,
-            "year": year,
-            "findings": merged_findings,
-            "overall_severity": overall,
-            "sections": sections,
-            "overall_summary": overall_summary,
-            "notes": notes,
-        }
+    report.organisation_ein = core.ein or report.organisation_ein
+    report.organisation_name = core.legal_name or report.organisation_name
+    report.year = year
+    report.findings = merged_findings
+    report.overall_severity = overall
+    report.sections = tuple(sections)
+    report.overall_summary = overall_summary
+    report.notes = notes
+    return report
+
+
+@cache
+def get_agent() -> Agent[ValidatorState, AuditReport]:
+    """Build the auditor agent on first use so importing the package stays cheap."""
+    agent = Agent(
+        model=get_azure_chat_model(),
+        name="FormValidator",
+        deps_type=ValidatorState,
+        output_type=AuditReport,
+        system_prompt=(
+            "You are a Form 990 auditor. Review the extraction data and deterministic "
+            "checks provided in deps. Use tools to confirm calculations, add or adjust "
+            "findings, supply mitigation guidance, and craft concise section summaries. "
+            "The AuditReport must include severity (`Pass`, `Warning`, `Error`), "
+            "confidence scores, mitigation advice, section summaries, and an overall "
+            "summary. Ground every statement in supplied data; do not invent financial "
+            "figures."
+        ),
+        tools=[revenue_check, expense_check, fundraising_alignment_check, verify_ein],
     )
+    agent.output_validator(finalize_report)
+    return agent
@@ -1,31 +1,116 @@
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+import sys
+from collections.abc import Sequence
+from itertools import groupby
+from operator import attrgetter
 
 from .models import (
+    SEVERITY_RANK,
     AuditFinding,
     AuditSectionSummary,
     ExtractedIrsForm990PfDataSchema,
+    GovernanceManagementDisclosure,
+    RevenueBreakdown,
     Severity,
 )
 
 
-def aggregate_findings(findings: list[AuditFinding]) -> Severity:
-    order = {Severity.ERROR: 3, Severity.WARNING: 2, Severity.PASS: 1}
+_REVENUE_COMPONENTS = tuple(
+    name for name in RevenueBreakdown.model_fields if name != "total_revenue"
+)
+# Row readers: one C-level call returns a breakdown's amounts as a tuple, the
+# reported total first.
+_revenue_row = attrgetter("total_revenue", *_REVENUE_COMPONENTS)
+_expense_row = attrgetter(
+    "total_expenses",
+    "program_services_expenses",
+    "management_general_expenses",
+    "fundraising_expenses",
+)
+_fundraising_row = attrgetter(
+    "expenses_breakdown.fundraising_expenses",
+    "fundraising_grantmaking.total_fundraising_event_expenses",
+)
+
+# Reconciliation checks compare whole cents so float drift in long sums cannot
+# push a matching total past the $1 tolerance.
+_TOLERANCE_CENTS = 100
+
+
+def _cents(amount: float) -> int:
+    return round(amount * 100)
+
+
+_NEGATIVE_OR_BLANK: frozenset[str] = frozenset({"", "no", "n", "false"})
+
+# (field, mitigation, is_policy): policies are flagged when blank or answered
+# "No"; the remaining disclosures only when left blank.
+_GOVERNANCE_CHECKS: tuple[tuple[str, str, bool], ...] = (
+    (
+        "conflict_of_interest_policy",
+        "Document the policy in Part VI or adopt one prior to filing.",
+        True,
+    ),
+    (
+        "whistleblower_policy",
+        "Document whistleblower protections for staff and volunteers.",
+        True,
+    ),
+    (
+        "document_retention_policy",
+        "Adopt and document a record retention policy.",
+        True,
+    ),
+    (
+        "financial_statements_reviewed",
+        "Capture whether the board reviewed or audited year-end financials.",
+        False,
+    ),
+    (
+        "form_990_provided_to_governing_body",
+        "Provide Form 990 to the board before submission and note the date of review.",
+        False,
+    ),
+)
+
+
+def _governance_text(field: str, is_policy: bool) -> tuple[str, str]:
+    label = field.replace("_", " ").title()
+    if is_policy:
+        return f"{field}_missing", f"{label} not reported or marked 'No'."
+    return f"{field}_blank", f"{label} left blank."
+
+
+# (check_id, message) per governance field, built once so every finding for a
+# field shares the same interned strings instead of formatting new ones.
+_GOVERNANCE_TEXT: dict[str, tuple[str, str]] = {
+    field: tuple(map(sys.intern, _governance_text(field, is_policy)))
+    for field, _, is_policy in _GOVERNANCE_CHECKS
+}
+
+_ERROR_RANK = SEVERITY_RANK[Severity.ERROR]
+
+
+def aggregate_findings(findings: Sequence[AuditFinding]) -> Severity:
+    rank_of = SEVERITY_RANK
     overall = Severity.PASS
+    best = rank_of[overall]
     for finding in findings:
-        if order[finding.severity] > order[overall]:
+        rank = rank_of[finding.severity]
+        if rank == _ERROR_RANK:
+            return Severity.ERROR
+        if rank > best:
+            best = rank
             overall = finding.severity
     return overall
 
 
 def check_revenue_totals(data: ExtractedIrsForm990PfDataSchema) -> AuditFinding:
-    subtotal = sum(
-        value
-        for key, value in data.revenue_breakdown.model_dump().items()
-        if key != "total_revenue"
-    )
-    if abs(subtotal - data.revenue_breakdown.total_revenue) <= 1:
+    total_revenue, *components = _revenue_row(data.revenue_breakdown)
+    subtotal_cents = sum(map(_cents, components))
+    subtotal = subtotal_cents / 100
+    if abs(subtotal_cents - _cents(total_revenue)) <= _TOLERANCE_CENTS:
         return AuditFinding(
             check_id="revenue_totals",
             category="Revenue",
@@ -40,7 +125,7 @@ def check_revenue_totals(data: ExtractedIrsForm990PfDataSchema) -> AuditFinding:
         severity=Severity.ERROR,
         message=(
             f"Revenue categories sum (${subtotal:,.2f}) does not equal reported total "
-            f"(${data.revenue_breakdown.total_revenue:,.2f})."
+            f"(${total_revenue:,.2f})."
         ),
         mitigation="Recalculate revenue totals and correct line items or Schedule A before filing.",
         confidence=0.95,
@@ -48,12 +133,10 @@ def check_revenue_totals(data: ExtractedIrsForm990PfDataSchema) -> AuditFinding:
 
 
 def check_expense_totals(data: ExtractedIrsForm990PfDataSchema) -> AuditFinding:
-    subtotal = (
-        data.expenses_breakdown.program_services_expenses
-        + data.expenses_breakdown.management_general_expenses
-        + data.expenses_breakdown.fundraising_expenses
-    )
-    if abs(subtotal - data.expenses_breakdown.total_expenses) <= 1:
+    total_expenses, *functional = _expense_row(data.expenses_breakdown)
+    subtotal_cents = sum(map(_cents, functional))
+    subtotal = subtotal_cents / 100
+    if abs(subtotal_cents - _cents(total_expenses)) <= _TOLERANCE_CENTS:
         return AuditFinding(
             check_id="expense_totals",
             category="Expenses",
@@ -68,7 +151,7 @@ def check_expense_totals(data: ExtractedIrsForm990PfDataSchema) -> AuditFinding:
         severity=Severity.ERROR,
         message=(
             f"Functional expenses (${subtotal:,.2f}) do not reconcile to total expenses "
-            f"(${data.expenses_breakdown.total_expenses:,.2f})."
+            f"(${total_expenses:,.2f})."
         ),
         mitigation="Review Part I, lines 23–27 and reclassify functional expenses to tie to Part II totals.",
         confidence=0.95,
@@ -78,10 +161,11 @@ def check_expense_totals(data: ExtractedIrsForm990PfDataSchema) -> AuditFinding:
 def check_fundraising_alignment(
     data: ExtractedIrsForm990PfDataSchema,
 ) -> AuditFinding:
-    reported_fundraising = data.expenses_breakdown.fundraising_expenses
-    event_expenses = data.fundraising_grantmaking.total_fundraising_event_expenses
-    difference = abs(reported_fundraising - event_expenses)
-    if difference <= 1:
+    reported_fundraising, event_expenses = _fundraising_row(data)
+    reported_cents = _cents(reported_fundraising)
+    difference_cents = abs(reported_cents - _cents(event_expenses))
+    difference = difference_cents / 100
+    if difference_cents <= _TOLERANCE_CENTS:
         return AuditFinding(
             check_id="fundraising_alignment",
             category="Fundraising",
@@ -92,7 +176,7 @@ def check_fundraising_alignment(
         )
     severity = (
         Severity.WARNING
-        if reported_fundraising and difference <= reported_fundraising * 0.1
+        if reported_cents and difference_cents * 10 <= reported_cents
         else Severity.ERROR
     )
     return AuditFinding(
@@ -111,7 +195,7 @@ def check_fundraising_alignment(
 def check_balance_sheet_presence(
     data: ExtractedIrsForm990PfDataSchema,
 ) -> AuditFinding:
-    if data.balance_sheet:
+    if data.balance_sheet.model_fields_set:
         return AuditFinding(
             check_id="balance_sheet_present",
             category="Balance Sheet",
@@ -130,58 +214,48 @@ def check_balance_sheet_presence(
     )
 
 
+def _should_flag(
+    gm: GovernanceManagementDisclosure, field: str, is_policy: bool
+) -> bool:
+    value = (getattr(gm, field) or "").strip()
+    if is_policy:
+        return value.lower() in _NEGATIVE_OR_BLANK
+    return not value
+
+
+def _governance_finding(field: str, mitigation: str, is_policy: bool) -> AuditFinding:
+    check_id, message = _GOVERNANCE_TEXT[field]
+    return AuditFinding(
+        check_id=check_id,
+        category="Governance",
+        severity=Severity.WARNING,
+        message=message,
+        mitigation=mitigation,
+        confidence=0.55 if is_policy else 0.5,
+    )
+
+
 def check_governance_policies(
     data: ExtractedIrsForm990PfDataSchema,
 ) -> list[AuditFinding]:
     gm = data.governance_management_disclosure
-    findings: list[AuditFinding] = []
-    policy_fields = {
-        "conflict_of_interest_policy": "Document the policy in Part VI or adopt one prior to filing.",
-        "whistleblower_policy": "Document whistleblower protections for staff and volunteers.",
-        "document_retention_policy": "Adopt and document a record retention policy.",
-    }
-    affirmative_fields = {
-        "financial_statements_reviewed": "Capture whether the board reviewed or audited year-end financials.",
-        "form_990_provided_to_governing_body": "Provide Form 990 to the board before submission and note the date of review.",
-    }
-
-    for field, mitigation in policy_fields.items():
-        value = (getattr(gm, field) or "").strip()
-        if not value or value.lower() in {"no", "n", "false"}:
-            findings.append(
-                AuditFinding(
-                    check_id=f"{field}_missing",
-                    category="Governance",
-                    severity=Severity.WARNING,
-                    message=f"{field.replace('_', ' ').title()} not reported or marked 'No'.",
-                    mitigation=mitigation,
-                    confidence=0.55,
-                )
-            )
-
-    for field, mitigation in affirmative_fields.items():
-        value = (getattr(gm, field) or "").strip()
-        if not value:
-            findings.append(
-                AuditFinding(
-                    check_id=f"{field}_blank",
-                    category="Governance",
-                    severity=Severity.WARNING,
-                    message=f"{field.replace('_', ' ').title()} left blank.",
-                    mitigation=mitigation,
-                    confidence=0.5,
-                )
-            )
-    return findings
+    return [
+        _governance_finding(field, mitigation, is_policy)
+        for field, mitigation, is_policy in _GOVERNANCE_CHECKS
+        if _should_flag(gm, field, is_policy)
+    ]
 
 
 def check_board_engagement(data: ExtractedIrsForm990PfDataSchema) -> AuditFinding:
-    hours = [
-        member.average_hours_per_week
-        for member in data.officers_directors_trustees_key_employees
-        if member.average_hours_per_week is not None
-    ]
-    total_hours = sum(hours)
+    # Stop summing once the threshold is met; the total is only reported below it.
+    total_hours = 0.0
+    for member in data.officers_directors_trustees_key_employees:
+        hours = member.average_hours_per_week
+        if hours is None:
+            continue
+        total_hours += hours
+        if total_hours >= 5:
+            break
     if total_hours >= 5:
         return AuditFinding(
             check_id="board_hours",
@@ -229,28 +303,38 @@ def check_missing_operational_details(
     )
 
 
-def build_section_summaries(findings: list[AuditFinding]) -> list[AuditSectionSummary]:
-    grouped: defaultdict[str, list[AuditFinding]] = defaultdict(list)
-    for finding in findings:
-        grouped[finding.category].append(finding)
+def _peak_severity(warnings: int, errors: int) -> Severity:
+    if errors:
+        return Severity.ERROR
+    if warnings:
+        return Severity.WARNING
+    return Severity.PASS
+
+
+def build_section_summaries(
+    findings: Sequence[AuditFinding],
+) -> list[AuditSectionSummary]:
+    by_category = attrgetter("category")
 
+    error, warning = Severity.ERROR, Severity.WARNING
     summaries: list[AuditSectionSummary] = []
-    severity_order = {Severity.ERROR: 3, Severity.WARNING: 2, Severity.PASS: 1}
-    for category, category_findings in grouped.items():
-        counter = Counter(f.severity for f in category_findings)
-        severity = aggregate_findings(category_findings)
-        summary = ", ".join(
-            f"{count} {label}"
-            for label, count in (
-                ("passes", counter.get(Severity.PASS, 0)),
-                ("warnings", counter.get(Severity.WARNING, 0)),
-                ("errors", counter.get(Severity.ERROR, 0)),
-            )
-        )
-        summary_text = f"{category} review: {summary}."
-        confidence = sum(f.confidence for f in category_findings) / len(
-            category_findings
+    for category, group in groupby(sorted(findings, key=by_category), by_category):
+        passes = warnings = errors = 0
+        confidence_total = 0.0
+        for finding in group:
+            confidence_total += finding.confidence
+            severity = finding.severity
+            if severity is error:
+                errors += 1
+            elif severity is warning:
+                warnings += 1
+            else:
+                passes += 1
+        severity = _peak_severity(warnings, errors)
+        summary_text = (
+            f"{category} review: {passes} passes, {warnings} warnings, {errors} errors."
         )
+        confidence = confidence_total / (passes + warnings + errors)
         summaries.append(
             AuditSectionSummary(
                 section=category,
@@ -259,23 +343,36 @@ def build_section_summaries(findings: list[AuditFinding]) -> list[AuditSectionSu
                 confidence=confidence,
             )
         )
-    summaries.sort(key=lambda s: (-severity_order[s.severity], s.section.lower()))
+    summaries.sort(key=lambda s: (-SEVERITY_RANK[s.severity], s.section.lower()))
     return summaries
 
 
-def compose_overall_summary(findings: list[AuditFinding]) -> str:
+def compose_overall_summary(findings: Sequence[AuditFinding]) -> str:
     if not findings:
         return "No automated findings generated."
-    counter = Counter(f.severity for f in findings)
+    error, warning = Severity.ERROR, Severity.WARNING
+    passes = warnings = errors = 0
+    for finding in findings:
+        severity = finding.severity
+        if severity is error:
+            errors += 1
+        elif severity is warning:
+            warnings += 1
+        else:
+            passes += 1
+    if errors and warnings and passes:
+        return (
+            f"Overall results: {errors} error(s), {warnings} warning(s), "
+            f"{passes} check(s) passed."
+        )
     parts = []
-    if counter.get(Severity.ERROR):
-        parts.append(f"{counter[Severity.ERROR]} error(s)")
-    if counter.get(Severity.WARNING):
-        parts.append(f"{counter[Severity.WARNING]} warning(s)")
-    if counter.get(Severity.PASS):
-        parts.append(f"{counter[Severity.PASS]} check(s) passed")
-    summary = "Overall results: " + ", ".join(parts) + "."
-    return summary
+    if errors:
+        parts.append(f"{errors} error(s)")
+    if warnings:
+        parts.append(f"{warnings} warning(s)")
+    if passes:
+        parts.append(f"{passes} check(s) passed")
+    return f"Overall results: {', '.join(parts)}."
 
 
 async def irs_ein_lookup(_ein: str) -> tuple[bool, float, str]:
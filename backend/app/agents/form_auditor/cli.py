@@ -2,21 +2,38 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+import hashlib
+import os
+import sys
 from pathlib import Path
 
+import orjson
+
 from . import build_audit_report
 
 __all__ = ["build_audit_report", "main"]
 
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "luma" / "audit"
+)
+
 
-def _load_payload(path: Path) -> dict:
-    text = path.read_text(encoding="utf-8")
-    return json.loads(text)
+def _cache_path(raw_payload: bytes) -> Path:
+    key = hashlib.blake2b(raw_payload, digest_size=16).hexdigest()
+    return _CACHE_DIR / f"{key}.json"
 
 
-def _print_report(report: dict) -> None:
-    print(json.dumps(report, indent=2))
+def _print_report(rendered: bytes) -> None:
+    """Write the cached compact JSON, pretty-printing it only for a terminal."""
+    if sys.stdout.isatty():
+        rendered = orjson.dumps(
+            orjson.loads(rendered),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+        )
+    else:
+        rendered += b"\n"
+    sys.stdout.buffer.write(rendered)
+    sys.stdout.flush()
 
 
 def main(argv: list[str] | None = None) -> None:
@@ -29,10 +46,34 @@ def main(argv: list[str] | None = None) -> None:
         default="example_data.json",
         help="Path to a JSON file containing the extraction payload.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run the audit even if a report for identical payload bytes is cached.",
+    )
     args = parser.parse_args(argv)
 
     payload_path = Path(args.payload).expanduser()
-    payload = _load_payload(payload_path)
+    raw_payload = payload_path.read_bytes()
+    cache_path = _cache_path(raw_payload)
+
+    if not args.no_cache:
+        try:
+            cached = cache_path.read_bytes()
+        except OSError:
+            pass
+        else:
+            _print_report(cached)
+            return
+
+    report = asyncio.run(build_audit_report(orjson.loads(raw_payload)))
+    rendered = report.model_dump_json().encode()
 
-    report = asyncio.run(build_audit_report(payload))
-    _print_report(report.model_dump())
+    # The cache is best effort: a read-only home or a full disk must not lose
+    # a report that has already been computed.
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(rendered)
+    except OSError:
+        pass
+    _print_report(rendered)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class Severity(str, Enum):
@@ -13,20 +14,36 @@ class Severity(str, Enum):
     ERROR = "Error"
 
 
-class AuditFinding(BaseModel):
+# Ordering of severities. Severity stays a str enum because "Pass"/"Warning"/
+# "Error" are the values clients and the LLM output schema exchange.
+SEVERITY_RANK: dict[Severity, int] = {
+    Severity.PASS: 1,
+    Severity.WARNING: 2,
+    Severity.ERROR: 3,
+}
+
+
+Confidence = Annotated[float, Field(ge=0.0, le=1.0)]
+
+
+# Plain slotted dataclasses: the checks build them without validation, while
+# pydantic still validates them when they arrive inside an AuditReport.
+@dataclass(slots=True, kw_only=True)
+class AuditFinding:
     check_id: str
     category: str
     severity: Severity
     message: str
     mitigation: str | None = None
-    confidence: float = Field(ge=0.0, le=1.0)
+    confidence: Confidence
 
 
-class AuditSectionSummary(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AuditSectionSummary:
     section: str
     severity: Severity
     summary: str
-    confidence: float = Field(ge=0.0, le=1.0)
+    confidence: Confidence
 
 
 class AuditReport(BaseModel):
@@ -34,20 +51,12 @@ class AuditReport(BaseModel):
     organisation_name: str
     year: int | None
     overall_severity: Severity
-    findings: list[AuditFinding]
-    sections: list[AuditSectionSummary] = Field(default_factory=list)
+    findings: tuple[AuditFinding, ...]
+    sections: tuple[AuditSectionSummary, ...] = ()
     overall_summary: str | None = None
     notes: str | None = None
 
 
-class CoreOrgMetadata(BaseModel):
-    ein: str
-    legal_name: str
-    return_type: str
-    accounting_method: str
-    incorporation_state: str | None = None
-
-
 class CoreOrganizationMetadata(BaseModel):
     ein: str = Field(
         ...,
@@ -246,7 +255,47 @@ class ExpensesBreakdown(BaseModel):
     insurance: float = Field(..., description="Insurance expenses.", title="Insurance")
 
 
+class BalanceSheet(BaseModel):
+    # Extractions report a varying set of Part II lines; the totals the audit
+    # relies on are typed, any other line is kept as reported.
+    model_config = ConfigDict(extra="allow")
+
+    total_assets: float | None = Field(
+        default=None,
+        description="Total assets at end of year.",
+        title="Total Assets",
+    )
+    total_liabilities: float | None = Field(
+        default=None,
+        description="Total liabilities at end of year.",
+        title="Total Liabilities",
+    )
+    net_assets: float | None = Field(
+        default=None,
+        description="Total net assets or fund balances at end of year.",
+        title="Net Assets / Fund Balances",
+    )
+
+    @field_validator("total_assets", "total_liabilities", "net_assets", mode="before")
+    @classmethod
+    def _lenient_amount(cls, value: Any) -> float | None:
+        # The extractor may send "1,234", "$1,234" or "N/A"; unreadable totals
+        # become None rather than failing the whole extraction.
+        if value is None or isinstance(value, bool):
+            return None
+        if isinstance(value, (int, float)):
+            return value
+        if isinstance(value, str):
+            try:
+                return float(value.strip().replace(",", "").replace("$", ""))
+            except ValueError:
+                return None
+        return None
+
+
 class OfficersDirectorsTrusteesKeyEmployee(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Full name of the individual.", title="Name")
     title_position: str = Field(
         ..., description="Role or position held.", title="Title/Position"
@@ -513,12 +562,14 @@ def _parse_officer_list(entries: list[str] | None) -> list[dict[str, Any]]:
     for raw in entries:
         if not isinstance(raw, str):
             continue
-        parts = [part.strip() for part in raw.split(",")]
-        name = parts[0] if parts else ""
-        title = parts[1] if len(parts) > 1 else ""
-        role = parts[3] if len(parts) > 3 else ""
+        # Only the name, title and governance role (1st, 2nd, 4th) are used.
+        parts = raw.split(",", 4)
+        name = parts[0].strip()
+        title = parts[1].strip() if len(parts) > 1 else ""
+        role = parts[3].strip() if len(parts) > 3 else ""
         hours = 0.0
-        match = _OFFICER_HOURS_PATTERN.search(raw)
+        # "N hrs/wk" needs a slash; skip the regex for entries without one.
+        match = _OFFICER_HOURS_PATTERN.search(raw) if "/" in raw else None
         if match:
             try:
                 hours = float(match.group(1))
@@ -540,175 +591,197 @@ def _parse_officer_list(entries: list[str] | None) -> list[dict[str, Any]]:
 def _build_program_accomplishments(
     descriptions: list[str] | None,
 ) -> list[dict[str, Any]]:
-    if not descriptions:
-        return []
-    programs: list[dict[str, Any]] = []
-    for idx, description in enumerate(descriptions, start=1):
-        if not isinstance(description, str):
-            continue
-        programs.append(
-            {
-                "program_name": f"Program {idx}",
-                "program_description": description.strip(),
-                "expenses": 0.0,
-                "grants": 0.0,
-                "revenue_generated": 0.0,
-                "quantitative_outputs": "",
-            }
-        )
-    return programs
+    # Programs are numbered by position in the source list, skipped entries included.
+    return [
+        {
+            "program_name": f"Program {idx}",
+            "program_description": description.strip(),
+            "expenses": 0.0,
+            "grants": 0.0,
+            "revenue_generated": 0.0,
+            "quantitative_outputs": "",
+        }
+        for idx, description in enumerate(descriptions or (), start=1)
+        if isinstance(description, str)
+    ]
+
+
+# (section, numeric fields, text fields) of the nested schema, read from the
+# flat payload under the same key. Numeric fields default to 0, text fields to
+# "" (and are stringified).
+_FLAT_SECTIONS: tuple[tuple[str, tuple[str, ...], tuple[str, ...]], ...] = (
+    (
+        "core_organization_metadata",
+        (),
+        (
+            "ein",
+            "legal_name",
+            "phone_number",
+            "website_url",
+            "return_type",
+            "amended_return",
+            "group_exemption_number",
+            "subsection_code",
+            "ruling_date",
+            "accounting_method",
+            "organization_type",
+            "year_of_formation",
+            "incorporation_state",
+            "calendar_year",
+        ),
+    ),
+    (
+        "revenue_breakdown",
+        (
+            "total_revenue",
+            "contributions_gifts_grants",
+            "program_service_revenue",
+            "membership_dues",
+            "investment_income",
+            "gains_losses_sales_assets",
+            "rental_income",
+            "related_organizations_revenue",
+            "gaming_revenue",
+            "other_revenue",
+            "government_grants",
+            "foreign_contributions",
+        ),
+        (),
+    ),
+    (
+        "expenses_breakdown",
+        (
+            "total_expenses",
+            "program_services_expenses",
+            "management_general_expenses",
+            "fundraising_expenses",
+            "grants_us_organizations",
+            "grants_us_individuals",
+            "grants_foreign_organizations",
+            "grants_foreign_individuals",
+            "compensation_officers",
+            "compensation_other_staff",
+            "payroll_taxes_benefits",
+            "professional_fees",
+            "office_occupancy_costs",
+            "information_technology_costs",
+            "travel_conference_expenses",
+            "depreciation_amortization",
+            "insurance",
+        ),
+        (),
+    ),
+    (
+        "governance_management_disclosure",
+        (
+            "governing_body_size",
+            "independent_members",
+        ),
+        (
+            "financial_statements_reviewed",
+            "form_990_provided_to_governing_body",
+            "conflict_of_interest_policy",
+            "whistleblower_policy",
+            "document_retention_policy",
+            "ceo_compensation_review_process",
+            "public_disclosure_practices",
+        ),
+    ),
+    (
+        "fundraising_grantmaking",
+        (
+            "total_fundraising_event_revenue",
+            "total_fundraising_event_expenses",
+            "professional_fundraiser_fees",
+        ),
+        (),
+    ),
+    (
+        "functional_operational_data",
+        (
+            "number_of_employees",
+            "number_of_volunteers",
+            "occupancy_costs",
+        ),
+        (
+            "fundraising_method_descriptions",
+            "joint_ventures_disregarded_entities",
+        ),
+    ),
+    (
+        "compensation_details",
+        (
+            "base_compensation",
+            "bonus",
+            "incentive",
+        ),
+        (
+            "non_fixed_compensation",
+            "first_class_travel",
+            "housing_allowance",
+            "expense_account_usage",
+            "supplemental_retirement",
+        ),
+    ),
+    (
+        "political_lobbying_activities",
+        (
+            "lobbying_expenditures_direct",
+            "lobbying_expenditures_grassroots",
+            "political_campaign_expenditures",
+        ),
+        (
+            "election_501h_status",
+            "related_organizations_affiliates",
+        ),
+    ),
+    (
+        "investments_endowment",
+        (
+            "donor_restricted_endowment_values",
+            "net_appreciation_depreciation",
+        ),
+        (
+            "investment_types",
+            "related_organization_transactions",
+            "loans_to_from_related_parties",
+        ),
+    ),
+    (
+        "tax_compliance_penalties",
+        (),
+        (
+            "penalties_excise_taxes_reported",
+            "unrelated_business_income_disclosure",
+            "foreign_bank_account_reporting",
+            "schedule_o_narrative_explanations",
+        ),
+    ),
+)
 
 
 def _transform_flat_payload(data: dict[str, Any]) -> dict[str, Any]:
-    def get_str(key: str) -> str:
-        value = data.get(key)
-        if value is None:
-            return ""
-        return str(value)
-
-    def get_value(key: str, default: Any = 0) -> Any:
-        return data.get(key, default)
-
-    transformed: dict[str, Any] = {
-        "core_organization_metadata": {
-            "ein": get_str("ein"),
-            "legal_name": get_str("legal_name"),
-            "phone_number": get_str("phone_number"),
-            "website_url": get_str("website_url"),
-            "return_type": get_str("return_type"),
-            "amended_return": get_str("amended_return"),
-            "group_exemption_number": get_str("group_exemption_number"),
-            "subsection_code": get_str("subsection_code"),
-            "ruling_date": get_str("ruling_date"),
-            "accounting_method": get_str("accounting_method"),
-            "organization_type": get_str("organization_type"),
-            "year_of_formation": get_str("year_of_formation"),
-            "incorporation_state": get_str("incorporation_state"),
-            "calendar_year": get_str("calendar_year"),
-        },
-        "revenue_breakdown": {
-            "total_revenue": get_value("total_revenue"),
-            "contributions_gifts_grants": get_value("contributions_gifts_grants"),
-            "program_service_revenue": get_value("program_service_revenue"),
-            "membership_dues": get_value("membership_dues"),
-            "investment_income": get_value("investment_income"),
-            "gains_losses_sales_assets": get_value("gains_losses_sales_assets"),
-            "rental_income": get_value("rental_income"),
-            "related_organizations_revenue": get_value("related_organizations_revenue"),
-            "gaming_revenue": get_value("gaming_revenue"),
-            "other_revenue": get_value("other_revenue"),
-            "government_grants": get_value("government_grants"),
-            "foreign_contributions": get_value("foreign_contributions"),
-        },
-        "expenses_breakdown": {
-            "total_expenses": get_value("total_expenses"),
-            "program_services_expenses": get_value("program_services_expenses"),
-            "management_general_expenses": get_value("management_general_expenses"),
-            "fundraising_expenses": get_value("fundraising_expenses"),
-            "grants_us_organizations": get_value("grants_us_organizations"),
-            "grants_us_individuals": get_value("grants_us_individuals"),
-            "grants_foreign_organizations": get_value("grants_foreign_organizations"),
-            "grants_foreign_individuals": get_value("grants_foreign_individuals"),
-            "compensation_officers": get_value("compensation_officers"),
-            "compensation_other_staff": get_value("compensation_other_staff"),
-            "payroll_taxes_benefits": get_value("payroll_taxes_benefits"),
-            "professional_fees": get_value("professional_fees"),
-            "office_occupancy_costs": get_value("office_occupancy_costs"),
-            "information_technology_costs": get_value("information_technology_costs"),
-            "travel_conference_expenses": get_value("travel_conference_expenses"),
-            "depreciation_amortization": get_value("depreciation_amortization"),
-            "insurance": get_value("insurance"),
-        },
-        "balance_sheet": data.get("balance_sheet") or {},
-        "officers_directors_trustees_key_employees": _parse_officer_list(
-            data.get("officers_list")
-        ),
-        "governance_management_disclosure": {
-            "governing_body_size": get_value("governing_body_size"),
-            "independent_members": get_value("independent_members"),
-            "financial_statements_reviewed": get_str("financial_statements_reviewed"),
-            "form_990_provided_to_governing_body": get_str(
-                "form_990_provided_to_governing_body"
-            ),
-            "conflict_of_interest_policy": get_str("conflict_of_interest_policy"),
-            "whistleblower_policy": get_str("whistleblower_policy"),
-            "document_retention_policy": get_str("document_retention_policy"),
-            "ceo_compensation_review_process": get_str(
-                "ceo_compensation_review_process"
-            ),
-            "public_disclosure_practices": get_str("public_disclosure_practices"),
-        },
-        "program_service_accomplishments": _build_program_accomplishments(
-            data.get("program_accomplishments_list")
-        ),
-        "fundraising_grantmaking": {
-            "total_fundraising_event_revenue": get_value(
-                "total_fundraising_event_revenue"
-            ),
-            "total_fundraising_event_expenses": get_value(
-                "total_fundraising_event_expenses"
-            ),
-            "professional_fundraiser_fees": get_value("professional_fundraiser_fees"),
-        },
-        "functional_operational_data": {
-            "number_of_employees": get_value("number_of_employees"),
-            "number_of_volunteers": get_value("number_of_volunteers"),
-            "occupancy_costs": get_value("occupancy_costs"),
-            "fundraising_method_descriptions": get_str(
-                "fundraising_method_descriptions"
-            ),
-            "joint_ventures_disregarded_entities": get_str(
-                "joint_ventures_disregarded_entities"
-            ),
-        },
-        "compensation_details": {
-            "base_compensation": get_value("base_compensation"),
-            "bonus": get_value("bonus"),
-            "incentive": get_value("incentive"),
-            "other": get_value("other_compensation", get_value("other", 0)),
-            "non_fixed_compensation": get_str("non_fixed_compensation"),
-            "first_class_travel": get_str("first_class_travel"),
-            "housing_allowance": get_str("housing_allowance"),
-            "expense_account_usage": get_str("expense_account_usage"),
-            "supplemental_retirement": get_str("supplemental_retirement"),
-        },
-        "political_lobbying_activities": {
-            "lobbying_expenditures_direct": get_value("lobbying_expenditures_direct"),
-            "lobbying_expenditures_grassroots": get_value(
-                "lobbying_expenditures_grassroots"
-            ),
-            "election_501h_status": get_str("election_501h_status"),
-            "political_campaign_expenditures": get_value(
-                "political_campaign_expenditures"
-            ),
-            "related_organizations_affiliates": get_str(
-                "related_organizations_affiliates"
-            ),
-        },
-        "investments_endowment": {
-            "investment_types": get_str("investment_types"),
-            "donor_restricted_endowment_values": get_value(
-                "donor_restricted_endowment_values"
-            ),
-            "net_appreciation_depreciation": get_value("net_appreciation_depreciation"),
-            "related_organization_transactions": get_str(
-                "related_organization_transactions"
-            ),
-            "loans_to_from_related_parties": get_str("loans_to_from_related_parties"),
-        },
-        "tax_compliance_penalties": {
-            "penalties_excise_taxes_reported": get_str(
-                "penalties_excise_taxes_reported"
-            ),
-            "unrelated_business_income_disclosure": get_str(
-                "unrelated_business_income_disclosure"
-            ),
-            "foreign_bank_account_reporting": get_str("foreign_bank_account_reporting"),
-            "schedule_o_narrative_explanations": get_str(
-                "schedule_o_narrative_explanations"
-            ),
-        },
-    }
+    get = data.get
+    transformed: dict[str, Any] = {}
+    for section, numeric_fields, text_fields in _FLAT_SECTIONS:
+        values = {name: get(name, 0) for name in numeric_fields}
+        for name in text_fields:
+            value = get(name)
+            if type(value) is not str:
+                value = "" if value is None else str(value)
+            values[name] = value
+        transformed[section] = values
+
+    transformed["compensation_details"]["other"] = get(
+        "other_compensation", get("other", 0)
+    )
+    transformed["balance_sheet"] = get("balance_sheet") or {}
+    transformed["officers_directors_trustees_key_employees"] = _parse_officer_list(
+        get("officers_list")
+    )
+    transformed["program_service_accomplishments"] = _build_program_accomplishments(
+        get("program_accomplishments_list")
+    )
     return transformed
 
 
@@ -728,13 +801,13 @@ class ExtractedIrsForm990PfDataSchema(BaseModel):
         description="Detailed breakdown of expenses for the fiscal year.",
         title="Expenses Breakdown",
     )
-    balance_sheet: dict[str, Any] = Field(
-        default_factory=dict,
+    balance_sheet: BalanceSheet = Field(
+        default_factory=BalanceSheet,
         description="Assets, liabilities, and net assets at year end.",
         title="Balance Sheet Data",
     )
-    officers_directors_trustees_key_employees: list[
-        OfficersDirectorsTrusteesKeyEmployee
+    officers_directors_trustees_key_employees: tuple[
+        OfficersDirectorsTrusteesKeyEmployee, ...
     ] = Field(
         ...,
         description="List of key personnel and their compensation.",
@@ -781,17 +854,28 @@ class ExtractedIrsForm990PfDataSchema(BaseModel):
         title="Tax Compliance / Penalties",
     )
 
-    @model_validator(mode="before")
-    @classmethod
-    def _ensure_structure(cls, value: Any) -> Any:
-        if not isinstance(value, dict):
-            return value
-        if "core_organization_metadata" in value:
-            return value
+
+def nest_flat_payload(value: Any) -> Any:
+    """
+    Reshape a flat extractor payload (top-level field keys, ``officers_list``)
+    into the nested schema; anything else passes through unchanged.
+    """
+    if isinstance(value, dict) and "core_organization_metadata" not in value:
         return _transform_flat_payload(value)
+    return value
+
+
+# Prebuilt pydantic-core validator for the hot path: skips the classmethod
+# dispatch of model_validate/model_validate_json on every payload.
+EXTRACTION_VALIDATOR = ExtractedIrsForm990PfDataSchema.__pydantic_validator__
 
 
-class ValidatorState(BaseModel):
+# Agent deps, never serialized: every field is already validated or built by
+# build_validator_state, so a plain dataclass skips revalidating the extraction.
+@dataclass(slots=True, kw_only=True)
+class ValidatorState:
     extraction: ExtractedIrsForm990PfDataSchema
-    initial_findings: list[AuditFinding] = Field(default_factory=list)
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    initial_findings: tuple[AuditFinding, ...] = ()
+    initial_findings_by_id: dict[str, AuditFinding] = field(default_factory=dict)
+    ein_lookup: tuple[bool, float, str] | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
@@ -1,25 +1,72 @@
 from __future__ import annotations
 
-from .agent import agent
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+
+from .agent import close_http_client, get_agent
 from .models import WebSearchResponse, WebSearchState
 
+__all__ = ["close_http_client", "search_web"]
+
+_CacheKey = tuple[str, int, bool]
+
+_responses: OrderedDict[_CacheKey, tuple[float, WebSearchResponse]] = OrderedDict()
+
+
+def _cache_key(query: str, max_results: int, include_raw_content: bool) -> _CacheKey:
+    # Case and whitespace differences do not change what Tavily returns.
+    return " ".join(query.lower().split()), max_results, include_raw_content
+
+
+def _cached_response(key: _CacheKey) -> WebSearchResponse | None:
+    entry = _responses.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if expires_at < time.monotonic():
+        del _responses[key]
+        return None
+    _responses.move_to_end(key)
+    return response
+
+
+def _store_response(key: _CacheKey, response: WebSearchResponse) -> None:
+    _responses[key] = (time.monotonic() + settings.WEB_SEARCH_CACHE_TTL, response)
+    _responses.move_to_end(key)
+    while len(_responses) > settings.WEB_SEARCH_CACHE_SIZE:
+        _responses.popitem(last=False)
+
 
 async def search_web(
     query: str,
     max_results: int = 5,
     include_raw_content: bool = False,
+    refresh: bool = False,
 ) -> WebSearchResponse:
     """
     Execute web search using Tavily MCP server.
 
+    Responses are cached in-process for ``WEB_SEARCH_CACHE_TTL`` seconds, keyed
+    on the normalized query and options. Cache hits are shallow copies whose
+    results are shared and must be treated as read-only.
+
     Args:
         query: Search query string
         max_results: Maximum number of results to return (1-10)
         include_raw_content: Whether to include full content in results
+        refresh: Skip the cache and run a fresh search
 
     Returns:
         WebSearchResponse with results and summary
     """
+    key = _cache_key(query, max_results, include_raw_content)
+    if not refresh:
+        cached = _cached_response(key)
+        if cached is not None:
+            return cached.model_copy(update={"query": query})
+
     state = WebSearchState(
         user_query=query,
         max_results=max_results,
@@ -33,5 +80,6 @@ async def search_web(
     )
 
     # Ejecutar agente con Tavily API directa
-    result = await agent.run(prompt, deps=state)
+    result = await get_agent().run(prompt, deps=state)
+    _store_response(key, result.output)
     return result.output
@@ -1,72 +1,107 @@
 from __future__ import annotations
 
+import asyncio
+from functools import cache
+
+import httpx
+from pydantic import TypeAdapter
 from pydantic_ai import Agent, RunContext
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.azure import AzureProvider
-from tavily import TavilyClient
+from tavily import AsyncTavilyClient
 
 from app.core.config import settings
+from app.core.llm import get_azure_chat_model
 
 from .models import WebSearchResponse, WebSearchState, SearchResult
 
+# One validator call per search instead of one SearchResult(...) per hit; extra
+# Tavily keys such as raw_content and favicon are ignored.
+_search_results = TypeAdapter(list[SearchResult])
+
+MAX_CONCURRENT_SEARCHES = 10
 
-provider = AzureProvider(
-    azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-    api_version=settings.AZURE_OPENAI_API_VERSION,
-    api_key=settings.AZURE_OPENAI_API_KEY,
-)
-model = OpenAIChatModel(model_name="gpt-4o", provider=provider)
 
+@cache
+def get_http_client() -> httpx.AsyncClient:
+    # Keep-alive pool shared by every search so repeated calls skip the TLS handshake.
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
 
-tavily_client = TavilyClient(api_key=settings.TAVILY_API_KEY)
 
-agent = Agent(
-    model=model,
-    name="WebSearchAgent",
-    deps_type=WebSearchState,
-    output_type=WebSearchResponse,
-    system_prompt=(
-        "You are a web search assistant powered by Tavily. "
-        "Use the tavily_search tool to find relevant, up-to-date information. "
-        "Return a structured WebSearchResponse with results and a concise summary. "
-        "Always cite your sources with URLs."
-    ),
-)
+@cache
+def get_tavily_client() -> AsyncTavilyClient:
+    return AsyncTavilyClient(api_key=settings.TAVILY_API_KEY, client=get_http_client())
 
 
-@agent.tool
-def tavily_search(ctx: RunContext[WebSearchState], query: str) -> list[SearchResult]:
-    """Search the web using Tavily API for up-to-date information."""
-    response = tavily_client.search(
+async def close_http_client() -> None:
+    """Close the pooled Tavily connections; the next search opens a fresh pool."""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+    get_tavily_client.cache_clear()
+    get_http_client.cache_clear()
+
+
+async def _search(state: WebSearchState, query: str) -> list[SearchResult]:
+    response = await get_tavily_client().search(
         query=query,
-        max_results=ctx.deps.max_results,
+        max_results=state.max_results,
         search_depth="basic",
-        include_raw_content=ctx.deps.include_raw_content,
+        include_raw_content=state.include_raw_content,
     )
+    return _search_results.validate_python(response.get("results", []))
+
 
-    results = []
-    for item in response.get("results", []):
-        results.append(
-            SearchResult(
-                title=item.get("title", ""),
-                url=item.get("url", ""),
-                content=item.get("content", ""),
-                score=item.get("score"),
-            )
-        )
+async def tavily_search(
+    ctx: RunContext[WebSearchState], query: str
+) -> list[SearchResult]:
+    """Search the web using Tavily API for up-to-date information."""
+    return await _search(ctx.deps, query)
+
+
+async def tavily_search_many(
+    ctx: RunContext[WebSearchState], queries: list[str]
+) -> list[list[SearchResult]]:
+    """Run several independent Tavily searches concurrently.
+
+    Returns one result list per query, in the same order as ``queries``.
+    """
+    limit = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
 
-    return results
+    async def bounded(query: str) -> list[SearchResult]:
+        async with limit:
+            return await _search(ctx.deps, query)
+
+    return list(await asyncio.gather(*map(bounded, queries)))
 
 
-@agent.output_validator
 def finalize_response(
     ctx: RunContext[WebSearchState],
     response: WebSearchResponse,
 ) -> WebSearchResponse:
     """Post-process and validate the search response"""
-    return response.model_copy(
-        update={
-            "query": ctx.deps.user_query,
-            "total_results": len(response.results),
-        }
+    response.query = ctx.deps.user_query
+    response.total_results = len(response.results)
+    return response
+
+
+@cache
+def get_agent() -> Agent[WebSearchState, WebSearchResponse]:
+    """Build the web search agent on first use so importing the package stays cheap."""
+    agent = Agent(
+        model=get_azure_chat_model(),
+        name="WebSearchAgent",
+        deps_type=WebSearchState,
+        output_type=WebSearchResponse,
+        system_prompt=(
+            "You are a web search assistant powered by Tavily. "
+            "Use the tavily_search tool to find relevant, up-to-date information. "
+            "When you need several independent searches, send them together in one "
+            "tavily_search_many call instead of calling tavily_search repeatedly. "
+            "Return a structured WebSearchResponse with results and a concise summary. "
+            "Always cite your sources with URLs."
+        ),
+        tools=[tavily_search, tavily_search_many],
     )
+    agent.output_validator(finalize_response)
+    return agent
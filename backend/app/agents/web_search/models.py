@@ -1,16 +1,24 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from typing import Any
+
+from pydantic import BaseModel, Field, field_validator
 
 
 class SearchResult(BaseModel):
     """Individual search result from web search"""
 
-    title: str
-    url: str
-    content: str
+    title: str = ""
+    url: str = ""
+    content: str = ""
     score: float | None = None
 
+    @field_validator("title", "url", "content", mode="before")
+    @classmethod
+    def _none_as_empty(cls, value: Any) -> Any:
+        # Tavily omits or nulls these on some hits; blank them instead of failing.
+        return "" if value is None else value
+
 
 class WebSearchState(BaseModel):
     """State passed to agent tools via deps"""
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List
 
 from pydantic import RedisDsn
@@ -48,6 +49,15 @@ class Settings(BaseSettings):
     EMBEDDING_DELAY_BETWEEN_BATCHES: float = 1.0
     EMBEDDING_MAX_RETRIES: int = 5
 
+    # Límites para las llamadas de los agentes (pydantic-ai) a Azure OpenAI
+    AGENT_MAX_CONCURRENT_RUNS: int = 8
+    AGENT_MAX_ATTEMPTS: int = 3
+    AGENT_RETRY_BASE_DELAY: float = 1.0
+
+    # Caché en memoria de búsquedas web (segundos de vigencia y número de entradas)
+    WEB_SEARCH_CACHE_TTL: float = 3600.0
+    WEB_SEARCH_CACHE_SIZE: int = 256
+
     # Google Cloud / Vertex AI configuración
     GOOGLE_APPLICATION_CREDENTIALS: str
     GOOGLE_CLOUD_PROJECT: str
@@ -69,5 +79,13 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Lee el entorno y el archivo .env una sola vez por proceso
+    """
+    return Settings.model_validate({})
+
+
 # Instancia global de configuración
-settings = Settings.model_validate({})
+settings = get_settings()
@@ -0,0 +1,43 @@
+from functools import lru_cache
+
+import httpx
+from pydantic_ai.models.openai import OpenAIChatModel
+from pydantic_ai.providers.azure import AzureProvider
+
+from .config import settings
+
+
+@lru_cache(maxsize=1)
+def _get_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        http2=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_azure_chat_model() -> OpenAIChatModel:
+    """
+    Modelo de chat de Azure OpenAI compartido por todos los agentes.
+
+    Un único provider y cliente HTTP reutilizan las conexiones (keep-alive)
+    entre el agente de chat, el analista, el auditor y la búsqueda web.
+    """
+    provider = AzureProvider(
+        azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
+        api_version=settings.AZURE_OPENAI_API_VERSION,
+        api_key=settings.AZURE_OPENAI_API_KEY,
+        http_client=_get_http_client(),
+    )
+    return OpenAIChatModel(model_name="gpt-4o", provider=provider)
+
+
+async def close_azure_http_client() -> None:
+    """
+    Cierra el pool HTTP de Azure OpenAI si llegó a crearse; el siguiente uso
+    construye un modelo y un pool nuevos.
+    """
+    if _get_http_client.cache_info().currsize:
+        await _get_http_client().aclose()
+    get_azure_chat_model.cache_clear()
+    _get_http_client.cache_clear()
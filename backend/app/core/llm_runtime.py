@@ -0,0 +1,75 @@
+import asyncio
+import logging
+import weakref
+from typing import Any, TypeVar
+
+from openai import APIConnectionError, RateLimitError
+from pydantic_ai import Agent
+from pydantic_ai.agent import AgentRunResult
+from pydantic_ai.exceptions import ModelHTTPError
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+OutputT = TypeVar("OutputT")
+
+# Un semáforo por event loop: un asyncio.Semaphore queda ligado al primer loop
+# que lo usa, y la CLI o los tests pueden ejecutar varios ``asyncio.run``.
+_RUN_SEMAPHORES: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Semaphore
+] = weakref.WeakKeyDictionary()
+
+
+def _run_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _RUN_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.AGENT_MAX_CONCURRENT_RUNS)
+        _RUN_SEMAPHORES[loop] = semaphore
+    return semaphore
+
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, (RateLimitError, APIConnectionError)):
+        return True
+    if isinstance(exc, ModelHTTPError):
+        return exc.status_code == 429 or exc.status_code >= 500
+    return False
+
+
+async def run_agent(
+    agent: Agent[Any, OutputT],
+    prompt: str,
+    deps: Any,
+    *,
+    max_attempts: int | None = None,
+    base_delay: float | None = None,
+) -> AgentRunResult[OutputT]:
+    """
+    Ejecuta ``agent.run`` con concurrencia limitada y reintentos.
+
+    Los errores transitorios (rate limit, 5xx, timeouts/conexión) se reintentan
+    con exponential backoff; el resto se propaga inmediatamente.
+    """
+    if max_attempts is None:
+        max_attempts = settings.AGENT_MAX_ATTEMPTS
+    if base_delay is None:
+        base_delay = settings.AGENT_RETRY_BASE_DELAY
+
+    attempt = 1
+    while True:
+        try:
+            async with _run_semaphore():
+                return await agent.run(prompt, deps=deps)
+        except Exception as e:
+            if attempt >= max_attempts or not _is_transient(e):
+                raise
+
+            wait_time = min(base_delay * 2 ** (attempt - 1), 30.0)
+            logger.warning(
+                f"Error transitorio en agente {agent.name}: {e}. "
+                f"Reintento {attempt}/{max_attempts - 1} en {wait_time}s..."
+            )
+            await asyncio.sleep(wait_time)
+            attempt += 1
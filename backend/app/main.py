@@ -1,4 +1,5 @@
 import logging
+import sys
 from contextlib import asynccontextmanager
 
 import uvicorn
@@ -7,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from .core.config import settings
+from .core.llm import close_azure_http_client
 from .routers.agent import router as agent_router
 from .routers.chunking import router as chunking_router
 from .routers.chunking_landingai import router as chunking_landingai_router
@@ -35,7 +37,12 @@ async def lifespan(_: FastAPI):
     yield
 
     logger.info("Cerrando File Manager API...")
-    # Cleanup de recursos si es necesario
+    # Importar la búsqueda web aquí cargaría pydantic-ai solo para cerrar un
+    # cliente que nunca se creó.
+    web_search = sys.modules.get(f"{__package__}.agents.web_search")
+    if web_search is not None:
+        await web_search.close_http_client()
+    await close_azure_http_client()
 
 
 app = FastAPI(
@@ -44,6 +51,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Configurar CORS para React frontend
@@ -59,9 +67,11 @@ app.add_middleware(
 # Middleware para logging de requests
 @app.middleware("http")
 async def log_requests(request, call_next):
-    logger.info(f"Request: {request.method} {request.url}")
+    if not logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
+    logger.info("Request: %s %s", request.method, request.url)
     response = await call_next(request)
-    logger.info(f"Response: {response.status_code}")
+    logger.info("Response: %s", response.status_code)
     return response
 
 
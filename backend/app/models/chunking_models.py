@@ -1,7 +1,7 @@
 """
 Modelos Pydantic para las operaciones de chunking.
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, model_validator
 from typing import List, Dict, Any, Optional
 
 
@@ -18,19 +18,14 @@ class ChunkingPreviewRequest(BaseModel):
     use_llm: bool = Field(default=True, description="Usar LLM (Gemini) para procesamiento inteligente")
     custom_instructions: str = Field(default="", description="Instrucciones personalizadas (solo si use_llm=True)")
 
-    @validator("custom_instructions")
-    def validate_custom_instructions(cls, v, values):
-        """Valida que custom_instructions solo se use con LLM habilitado"""
-        if v and not values.get("use_llm", True):
+    @model_validator(mode="after")
+    def validate_options(self):
+        """Valida que custom_instructions solo se use con LLM y que target_tokens sea menor que max_tokens"""
+        if self.custom_instructions and not self.use_llm:
             raise ValueError("custom_instructions solo puede usarse cuando use_llm=True")
-        return v
-
-    @validator("target_tokens")
-    def validate_target_tokens(cls, v, values):
-        """Valida que target_tokens sea menor que max_tokens"""
-        if "max_tokens" in values and v >= values["max_tokens"]:
+        if self.target_tokens >= self.max_tokens:
             raise ValueError("target_tokens debe ser menor que max_tokens")
-        return v
+        return self
 
 
 class ChunkingProcessRequest(BaseModel):
@@ -45,19 +40,14 @@ class ChunkingProcessRequest(BaseModel):
     use_llm: bool = Field(default=True, description="Usar LLM (Gemini) para procesamiento inteligente")
     custom_instructions: str = Field(default="", description="Instrucciones personalizadas (solo si use_llm=True)")
 
-    @validator("custom_instructions")
-    def validate_custom_instructions(cls, v, values):
-        """Valida que custom_instructions solo se use con LLM habilitado"""
-        if v and not values.get("use_llm", True):
+    @model_validator(mode="after")
+    def validate_options(self):
+        """Valida que custom_instructions solo se use con LLM y que target_tokens sea menor que max_tokens"""
+        if self.custom_instructions and not self.use_llm:
             raise ValueError("custom_instructions solo puede usarse cuando use_llm=True")
-        return v
-
-    @validator("target_tokens")
-    def validate_target_tokens(cls, v, values):
-        """Valida que target_tokens sea menor que max_tokens"""
-        if "max_tokens" in values and v >= values["max_tokens"]:
+        if self.target_tokens >= self.max_tokens:
             raise ValueError("target_tokens debe ser menor que max_tokens")
-        return v
+        return self
 
 
 # Response Models
@@ -70,6 +60,11 @@ class ChunkPreview(BaseModel):
     file_name: str = Field(..., description="Nombre del archivo")
     tokens: int = Field(..., description="Número aproximado de tokens")
 
+    @classmethod
+    def fast(cls, index: int, text: str, page: int, file_name: str, tokens: int) -> "ChunkPreview":
+        """Construye el chunk sin validar; solo para datos generados por el servicio de chunking"""
+        return cls.model_construct(index=index, text=text, page=page, file_name=file_name, tokens=tokens)
+
 
 class ChunkingPreviewResponse(BaseModel):
     """Response para preview de chunks"""
@@ -79,15 +74,6 @@ class ChunkingPreviewResponse(BaseModel):
     chunks: List[ChunkPreview] = Field(..., description="Lista de chunks de preview (hasta 3)")
     message: str = Field(default="Preview generado exitosamente", description="Mensaje descriptivo")
 
-    @validator("chunks")
-    def validate_chunk_count(cls, v):
-        """Valida que haya al menos 1 chunk y máximo 3 chunks en el preview"""
-        if len(v) < 1:
-            raise ValueError("El preview debe contener al menos 1 chunk")
-        if len(v) > 3:
-            raise ValueError("El preview no puede contener más de 3 chunks")
-        return v
-
 
 class ChunkingProcessResponse(BaseModel):
     """Response para procesamiento completo"""
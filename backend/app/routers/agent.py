@@ -1,43 +1,36 @@
 import json
 import logging
 from dataclasses import dataclass
+from functools import cache
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Header
+from fastapi import APIRouter, Depends, Header
 from pydantic_ai import Agent, RunContext
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.azure import AzureProvider
 from pydantic_ai.ui.vercel_ai import VercelAIAdapter
 from starlette.requests import Request
 from starlette.responses import Response
 
-from app.agents import analyst, form_auditor, web_search
-from app.core.config import settings
+from app.agents._extraction_cache import extraction_cache_scope
+from app.core.llm import get_azure_chat_model
 from app.services.extracted_data_service import get_extracted_data_service
 
-provider = AzureProvider(
-    azure_endpoint=settings.AZURE_OPENAI_ENDPOINT,
-    api_version=settings.AZURE_OPENAI_API_VERSION,
-    api_key=settings.AZURE_OPENAI_API_KEY,
-)
-model = OpenAIChatModel(model_name="gpt-4o", provider=provider)
-
 
 @dataclass
 class Deps:
     extracted_data: list[dict[str, Any]]
 
 
-agent = Agent(model=model, deps_type=Deps)
-
 router = APIRouter(prefix="/api/v1/agent", tags=["Agent"])
 
 logger = logging.getLogger(__name__)
 
 
-@agent.tool
+# Subagent packages are imported inside the tools so that starting the API does
+# not pay for them (Tavily, numpy, the Form 990 schema) until a chat needs them.
 async def build_audit_report(ctx: RunContext[Deps]):
     """Calls the audit subagent to get a full audit report of the organization"""
+    from app.agents import form_auditor
+
     data = ctx.deps.extracted_data[0]
 
     result = await form_auditor.build_audit_report(data)
@@ -45,9 +38,10 @@ async def build_audit_report(ctx: RunContext[Deps]):
     return result.model_dump()
 
 
-@agent.tool
 async def build_analysis_report(ctx: RunContext[Deps]):
     """Calls the analyst subagent to get a full report of the organization's performance across years"""
+    from app.agents import analyst
+
     data = ctx.deps.extracted_data
     if not data:
         raise ValueError("No extracted data available for analysis.")
@@ -62,15 +56,44 @@ async def build_analysis_report(ctx: RunContext[Deps]):
     return result.model_dump()
 
 
-@agent.tool_plain
+async def build_combined_report(ctx: RunContext[Deps]):
+    """Calls the analyst and audit subagents in parallel to get both the multi-year performance report and the audit report of the latest filing"""
+    from app.agents import coordinator
+
+    data = ctx.deps.extracted_data
+    if not data:
+        raise ValueError("No extracted data available for analysis.")
+
+    result = await coordinator.build_combined_report(data)
+
+    return result.model_dump()
+
+
 async def search_web_information(query: str, max_results: int = 5):
     """Search the web for up-to-date information using Tavily. Use this when you need current information, news, research, or facts not in your knowledge base."""
+    from app.agents import web_search
+
     result = await web_search.search_web(query=query, max_results=max_results)
 
     return result.model_dump()
 
 
-@router.post("/chat")
+@cache
+def get_agent() -> Agent[Deps, str]:
+    """Build the chat agent on first request so importing the router stays cheap."""
+    return Agent(
+        model=get_azure_chat_model(),
+        deps_type=Deps,
+        tools=[
+            build_audit_report,
+            build_analysis_report,
+            build_combined_report,
+            search_web_information,
+        ],
+    )
+
+
+@router.post("/chat", dependencies=[Depends(extraction_cache_scope)])
 async def chat(request: Request, tema: Annotated[str, Header()]) -> Response:
     extracted_data_service = get_extracted_data_service()
 
@@ -82,4 +105,4 @@ async def chat(request: Request, tema: Annotated[str, Header()]) -> Response:
 
     deps = Deps(extracted_data=extracted_data)
 
-    return await VercelAIAdapter.dispatch_request(request, agent=agent, deps=deps)
+    return await VercelAIAdapter.dispatch_request(request, agent=get_agent(), deps=deps)
@@ -108,9 +108,14 @@ async def generate_preview(request: ChunkingPreviewRequest):
             custom_instructions=request.custom_instructions
         )
 
-        # Convertir a modelos Pydantic
+        if not 1 <= len(chunks) <= 3:
+            raise ValueError(
+                f"El preview debe contener entre 1 y 3 chunks (se obtuvieron {len(chunks)})"
+            )
+
+        # Convertir a modelos Pydantic (datos propios del servicio, sin revalidar)
         chunk_previews = [
-            ChunkPreview(
+            ChunkPreview.fast(
                 index=chunk["index"],
                 text=chunk["text"],
                 page=chunk["page"],
@@ -186,8 +186,9 @@ Texto:
         total_time = time.time() - overall_start
         if processed_chunks:
             avg_tokens = sum(
-                self.token_manager.count_tokens(chunk.page_content)
-                for chunk in processed_chunks
+                self.token_manager.count_tokens_batch(
+                    [chunk.page_content for chunk in processed_chunks]
+                )
             ) / len(processed_chunks)
         else:
             avg_tokens = 0
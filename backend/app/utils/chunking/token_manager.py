@@ -2,6 +2,9 @@
 Gestor de tokens para contar y truncar texto basado en modelos de tokenización.
 """
 import logging
+import os
+from typing import List
+
 import tiktoken
 
 logger = logging.getLogger(__name__)
@@ -37,6 +40,28 @@ class TokenManager:
         """
         return len(self.encoding.encode(text))
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Cuenta los tokens de varios textos en una sola llamada.
+
+        tiktoken codifica el lote en hilos nativos sin el GIL; con un solo
+        núcleo el reparto no compensa y se cuentan uno a uno.
+
+        Args:
+            texts: Textos a analizar
+
+        Returns:
+            Número de tokens de cada texto, en el mismo orden
+        """
+        num_threads = min(8, os.cpu_count() or 1)
+        if num_threads == 1 or len(texts) < 2:
+            return [self.count_tokens(text) for text in texts]
+        # Mismos tokens especiales que encode(), para que coincida con count_tokens
+        return [
+            len(tokens)
+            for tokens in self.encoding.encode_batch(texts, num_threads=num_threads)
+        ]
+
     def truncate_to_tokens(
         self,
         text: str,
@@ -0,0 +1,17 @@
+"""Dummy settings so ``app.core.config`` imports; nothing here reaches a service."""
+
+import os
+
+os.environ.setdefault("REDIS_OM_URL", "redis://localhost:6379")
+for _name in (
+    "AZURE_STORAGE_CONNECTION_STRING",
+    "QDRANT_URL",
+    "QDRANT_API_KEY",
+    "AZURE_OPENAI_ENDPOINT",
+    "AZURE_OPENAI_API_KEY",
+    "GOOGLE_APPLICATION_CREDENTIALS",
+    "GOOGLE_CLOUD_PROJECT",
+    "LANDINGAI_API_KEY",
+    "TAVILY_API_KEY",
+):
+    os.environ.setdefault(_name, "x")
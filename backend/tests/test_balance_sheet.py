@@ -0,0 +1,29 @@
+import unittest
+
+import _settings_env  # noqa: F401
+from app.agents.form_auditor.models import BalanceSheet
+
+
+class BalanceSheetTest(unittest.TestCase):
+    def test_extractor_strings_are_normalised(self):
+        sheet = BalanceSheet.model_validate(
+            {
+                "total_assets": "$1,234.50",
+                "total_liabilities": "N/A",
+                "net_assets": 700,
+                "cash": "see schedule",
+            }
+        )
+
+        self.assertEqual(sheet.total_assets, 1234.5)
+        self.assertIsNone(sheet.total_liabilities)
+        self.assertEqual(sheet.net_assets, 700.0)
+        self.assertEqual(sheet.model_extra, {"cash": "see schedule"})
+        self.assertEqual(
+            sheet.model_fields_set,
+            {"total_assets", "total_liabilities", "net_assets", "cash"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
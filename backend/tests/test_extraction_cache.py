@@ -0,0 +1,45 @@
+import asyncio
+import copy
+import json
+import unittest
+from pathlib import Path
+
+import _settings_env  # noqa: F401
+from app.agents._extraction_cache import extraction_cache_scope, validate_extraction
+
+EXAMPLE = json.loads(
+    (Path(__file__).parents[1] / "app" / "example_data.json").read_text()
+)["extraction"]
+
+
+def _filing(total_revenue: float) -> dict:
+    extraction = copy.deepcopy(EXAMPLE)
+    extraction["core_organization_metadata"].pop("calendar_year", None)
+    extraction["revenue_breakdown"]["total_revenue"] = total_revenue
+    return extraction
+
+
+class ExtractionCacheTest(unittest.TestCase):
+    def _validate_in_scope(self, payloads):
+        async def run():
+            await extraction_cache_scope()
+            return [validate_extraction(payload) for payload in payloads]
+
+        return asyncio.run(run())
+
+    def test_same_ein_without_calendar_year_keeps_each_filing(self):
+        extractions = self._validate_in_scope([_filing(5227), _filing(9999)])
+
+        self.assertEqual(
+            [e.revenue_breakdown.total_revenue for e in extractions], [5227, 9999]
+        )
+
+    def test_identical_payload_is_validated_once(self):
+        payload = _filing(5227)
+        first, second = self._validate_in_scope([payload, copy.deepcopy(payload)])
+
+        self.assertIs(first, second)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import asyncio
+import unittest
+
+import _settings_env  # noqa: F401
+from openai import APIConnectionError
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
+
+from app.core.llm_runtime import run_agent
+
+
+class _FlakyAgent:
+    name = "flaky"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def run(self, prompt, deps=None):
+        self.calls += 1
+        raise APIConnectionError(request=None)
+
+
+class RunAgentTest(unittest.TestCase):
+    def test_runs_in_separate_event_loops(self):
+        agent = Agent(TestModel(custom_output_text="ok"))
+
+        for _ in range(2):
+            result = asyncio.run(run_agent(agent, "hola", None))
+            self.assertEqual(result.output, "ok")
+
+    def test_explicit_zero_delay_is_honoured(self):
+        agent = _FlakyAgent()
+
+        with self.assertRaises(APIConnectionError):
+            asyncio.run(run_agent(agent, "hola", None, max_attempts=2, base_delay=0))
+        self.assertEqual(agent.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+
+import _settings_env  # noqa: F401
+from app.agents.web_search.agent import _search_results
+
+
+class SearchResultsTest(unittest.TestCase):
+    def test_partial_hits_are_blanked_instead_of_failing(self):
+        results = _search_results.validate_python(
+            [
+                {"url": "https://example.org", "content": None, "score": 0.4},
+                {"title": "Full", "url": "u", "content": "c", "raw_content": None},
+            ]
+        )
+
+        self.assertEqual(
+            [(r.title, r.url, r.content, r.score) for r in results],
+            [("", "https://example.org", "", 0.4), ("Full", "u", "c", None)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()